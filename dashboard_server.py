@@ -4,23 +4,76 @@ Simple Flask server for the MercadoLivre AI Agent Dashboard
 Provides endpoints to run the real agent system and stream output.
 """
 
+import hashlib
+import heapq
+import itertools
 import subprocess
 import os
+import queue
 import sys
 import threading
 import time
-from flask import Flask, jsonify, Response, send_file
+from flask import Flask, jsonify, request, Response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import json
 import random
+import re
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:  # Optional; responses are sent uncompressed
+    Compress = None
+
 app = Flask(__name__)
 CORS(app)
 
-# Global variables to track running processes
-current_process = None
-is_running = False
+if Compress is not None:
+    # Live agent streams are left alone: the compressor only flushes at the
+    # end of a stream, which would hold every frame back until the run ends
+    app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_STREAMS'] = False
+    Compress(app)
+
+if orjson is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """Route jsonify and request.get_json through orjson"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+    def _dumps_bytes(obj):
+        return orjson.dumps(obj)
+else:
+    def _dumps_bytes(obj):
+        return json.dumps(obj).encode('utf-8')
+
+@dataclass
+class AgentJob:
+    """A run of the agent system started by /run-agents"""
+    proc: subprocess.Popen
+
+    @property
+    def running(self):
+        return self.proc.poll() is None
+
+# The agent run is exclusive; every read or write of _JOB holds _JOB_LOCK
+_JOB_LOCK = threading.Lock()
+_JOB = None
 
 # Standardized persona interaction data
 PERSONA_INTERACTIONS = {
@@ -173,6 +226,9 @@ PERSONA_INTERACTIONS = {
     }
 }
 
+_PERSONA_KEYS = tuple(PERSONA_INTERACTIONS)
+_PERSONA_TITLES = {key: key.replace('_', ' ').title() for key in _PERSONA_KEYS}
+
 COMPANY_AGENT_WORK = {
     "company_context_agent": {
         "analysis": [
@@ -236,594 +292,859 @@ COMPANY_AGENT_WORK = {
     }
 }
 
-@app.route('/')
-def dashboard():
-    """Serve the dashboard HTML file"""
-    return send_file('admin_dashboard.html')
+# Questions the Feedback Collection Agent asks every persona
+SURVEY_QUESTIONS = tuple(COMPANY_AGENT_WORK["feedback_collection_agent"]["questions_asked"])
 
-@app.route('/run-clean-agents', methods=['POST'])
-def run_clean_agents():
-    """Run an interactive agent flow simulation with detailed interactions"""
-    def generate():
-        yield f"data: 🚀 Starting Enhanced MercadoLivre Agent Analysis with Interactive Flow...\n\n"
-        time.sleep(1)
+# Streaming headers: stop reverse proxies from buffering the SSE output
+SSE_HEADERS = {'X-Accel-Buffering': 'no', 'Cache-Control': 'no-cache'}
 
-        # Phase 1: Company Context Agent Analysis
-        yield f"data: 🏢 Phase 1: Company Context Agent Gathering Market Intelligence...\n\n"
-        yield f"data: ═══════════════════════════════════════\n\n"
-        yield f"data: 📊 Company Context Agent Analyzing Market Data...\n\n"
-        yield f"data: • Analyzing marketplace structure and user behavior patterns\n\n"
-        yield f"data: • Mapping product categories and search algorithms\n\n"
-        yield f"data: • Evaluating competitor strategies and positioning\n\n"
-        time.sleep(2)
-
-        # Company Context Agent Market Analysis Results
-        yield f"data: \n📈 Company Context Agent Market Analysis Results:\n\n"
-        for insight in COMPANY_AGENT_WORK["company_context_agent"]["analysis"][:3]:
-            yield f"data: • {insight}\n\n"
-            time.sleep(0.8)
-
-        # Context being passed to Feedback Collection Agent
-        yield f"data: \n💼 Company Context Agent Sending Context to Feedback Collection Agent:\n\n"
-        for context_item in COMPANY_AGENT_WORK["company_context_agent"]["context_provided"][:3]:
-            yield f"data: ➤ {context_item}\n\n"
-            time.sleep(0.7)
-        yield f"data: ═══════════════════════════════════════\n\n"
-        time.sleep(1)
+THICK_RULE = "═══════════════════════════════════════"
+THIN_RULE = "───────────────────────────────"
+WIDE_RULE = "══════════════════════════════════════════════════"
 
-        # Phase 2: Feedback Collection Agent Preparation
-        yield f"data: 🎙️ Phase 2: Feedback Collection Agent Preparing Research...\n\n"
-        yield f"data: ═══════════════════════════════════════\n\n"
-        yield f"data: 📝 Feedback Collection Agent Planning Research Based on Market Context...\n\n"
-        yield f"data: • Developing structured interview questions based on market context\n\n"
-        yield f"data: • Selecting representative user personas for research\n\n"
-        yield f"data: • Preparing survey instruments and usability tests\n\n"
-
-        # Show interview questions prepared
-        yield f"data: \n❓ Feedback Collection Agent Preparing Interview Questions:\n\n"
-        for question in COMPANY_AGENT_WORK["feedback_collection_agent"]["questions_asked"]:
-            yield f"data: • \"{question}\"\n\n"
-            time.sleep(0.8)
-
-        # Loading Personas
-        yield f"data: \n👥 Feedback Collection Agent Loading Diverse Personas...\n\n"
-        personas = list(PERSONA_INTERACTIONS.keys())
-        yield f"data: Loaded {len(personas)} diverse personas for interviews\n\n"
-        for persona in personas:
-            yield f"data: • {persona.replace('_', ' ').title()} - Ready for interview\n\n"
-            time.sleep(0.5)
-        yield f"data: ═══════════════════════════════════════\n\n"
-        time.sleep(1)
-
-        # Phase 3: Feedback Collection Agent Conducting Interviews
-        yield f"data: 🔍 Phase 3: Feedback Collection Agent Conducting Interviews...\n\n"
-
-        # For each persona, show interview process
-        for persona_type, data in PERSONA_INTERACTIONS.items():
-            persona_name = persona_type.replace('_', ' ').title()
-            yield f"data: \n\n"
-            yield f"data: 🤖 Interviewing {persona_name} Persona...\n\n"
-            yield f"data: ───────────────────────────────\n\n"
-
-            # Show questions being asked by Feedback Collection Agent
-            yield f"data: 💬 Feedback Collection Agent Questions:\n\n"
-            questions = COMPANY_AGENT_WORK["feedback_collection_agent"]["questions_asked"]
-            for i, question in enumerate(questions[:2], 1):
-                yield f"data: Q{i}: \"{question}\"\n\n"
-                time.sleep(0.5)
-
-                # Show persona responses based on their characteristics
-                if i == 1:  # First question about satisfaction
-                    if persona_type == "tech_enthusiast":
-                        yield f"data: A{i}: \"I'm generally satisfied with the technical specifications provided, but I wish there were more detailed comparison tools.\"\n\n"
-                    elif persona_type == "budget_shopper":
-                        yield f"data: A{i}: \"I like the price filtering options, but sometimes shipping costs aren't clear until checkout which is frustrating.\"\n\n"
-                    else:  # Gift buyer
-                        yield f"data: A{i}: \"Gift options are limited and it's hard to schedule delivery for specific dates.\"\n\n"
-                else:  # Second question about difficult features
-                    if persona_type == "tech_enthusiast":
-                        yield f"data: A{i}: \"Finding compatibility information between products is challenging. I often have to research elsewhere.\"\n\n"
-                    elif persona_type == "budget_shopper":
-                        yield f"data: A{i}: \"The coupon system is confusing. Sometimes discounts don't apply as expected.\"\n\n"
-                    else:  # Gift buyer
-                        yield f"data: A{i}: \"Gift wrapping options are hard to find, and I can't add personalized messages easily.\"\n\n"
-                time.sleep(0.8)
-
-            # Show observed behaviors collected by Feedback Collection Agent
-            yield f"data: \n📋 Observed Shopping Behaviors:\n\n"
-            for behavior in data["behaviors"][:2]:
-                yield f"data: • {behavior}\n\n"
-                time.sleep(0.7)
-
-            # Show key decisions captured
-            yield f"data: \n✅ Key Decision Patterns Identified:\n\n"
-            for decision in data["decisions"][:2]:
-                yield f"data: ➤ {decision}\n\n"
-                time.sleep(0.6)
-
-            observations = random.randint(3, 7)
-            yield f"data: \n📊 Total Insights Collected: {observations}\n\n"
-            yield f"data: ───────────────────────────────\n\n"
-            time.sleep(1)
+# Pacing between persona interviews in the clean agents flow
+INTERVIEW_DELAY = 0.4
 
-        # Phase 4: Feedback Collection Agent Processing and Sending to Data Agent
-        yield f"data: 📊 Phase 4: Feedback Collection Agent Processing Results...\n\n"
-        yield f"data: ═══════════════════════════════════════\n\n"
-        yield f"data: • Consolidating interview responses across all personas\n\n"
-        yield f"data: • Identifying patterns in user feedback\n\n"
-        yield f"data: • Preparing data package for Data Agent analysis\n\n"
-        time.sleep(2)
-
-        # Show feedback summary being passed to Data Agent
-        yield f"data: \n📤 Feedback Collection Agent Sending Processed Data to Data Agent:\n\n"
-        yield f"data: • Interview transcripts from 3 distinct persona types\n\n"
-        yield f"data: • Survey responses with satisfaction metrics\n\n"
-        yield f"data: • Observed behaviors and decision patterns\n\n"
-        yield f"data: • Feature request and pain point documentation\n\n"
-        yield f"data: ═══════════════════════════════════════\n\n"
-        time.sleep(1)
+# Longest a scripted stream waits for its next step before giving up
+PACER_STALL_TIMEOUT = 30
 
-        # Phase 5: Data Agent Analysis
-        yield f"data: 📈 Phase 5: Data Agent Analyzing Feedback Data...\n\n"
-        yield f"data: ═══════════════════════════════════════\n\n"
-        yield f"data: • Processing received data from Feedback Collection Agent\n\n"
-        yield f"data: • Integrating with market context from Company Context Agent\n\n"
-        yield f"data: • Running statistical analysis on user behavior patterns\n\n"
-        time.sleep(2)
-
-        # Data Agent analysis results
-        yield f"data: \n🔬 Data Agent Analysis Results:\n\n"
-        for analysis in COMPANY_AGENT_WORK["data_agent"]["analysis"]:
-            yield f"data: • {analysis}\n\n"
-            time.sleep(0.7)
-
-        # Data Agent insights
-        yield f"data: \n💡 Key Insights Generated:\n\n"
-        for insight in COMPANY_AGENT_WORK["data_agent"]["insights"]:
-            yield f"data: ➤ {insight}\n\n"
-            time.sleep(0.8)
-        yield f"data: ═══════════════════════════════════════\n\n"
-        time.sleep(1)
+# Endpoints that stream "data: ..." frames to the dashboard
+SSE_ENDPOINTS = frozenset({'run_clean_agents', 'run_agents', 'run_simulation'})
 
-        # Phase 6: Synthesis and Recommendations
-        yield f"data: 🏆 Phase 6: Generating Final Recommendations...\n\n"
-        yield f"data: • Consolidating insights from all three agents\n\n"
-        yield f"data: • Prioritizing recommendations based on business impact\n\n"
-        yield f"data: • Formulating implementation roadmap\n\n"
-        time.sleep(2)
-
-        # Final recommendations from all agents
-        yield f"data: \n📊 Final Prioritized Recommendations:\n\n"
-        recommendations = [
-            "Implement detailed product comparison tool based on Tech Enthusiast feedback",
-            "Create transparent shipping calculator earlier in purchase journey for Budget Shoppers",
-            "Develop enhanced gift options with scheduling for Gift Buyers",
-            "Redesign coupon system for better clarity and predictability",
-            "Improve mobile search and filtering based on cross-persona feedback"
-        ]
-        for i, rec in enumerate(recommendations, 1):
-            yield f"data: {i}. {rec}\n\n"
-            time.sleep(0.8)
+@app.after_request
+def label_event_streams(response):
+    """Send agent streams as UTF-8 event streams so clients never sniff the charset"""
+    if request.endpoint in SSE_ENDPOINTS and response.mimetype != 'application/json':
+        response.headers['Content-Type'] = 'text/event-stream; charset=utf-8'
+        response.headers.update(SSE_HEADERS)
+    return response
+
+FINAL_RECOMMENDATIONS = [
+    "Implement detailed product comparison tool based on Tech Enthusiast feedback",
+    "Create transparent shipping calculator earlier in purchase journey for Budget Shoppers",
+    "Develop enhanced gift options with scheduling for Gift Buyers",
+    "Redesign coupon system for better clarity and predictability",
+    "Improve mobile search and filtering based on cross-persona feedback"
+]
 
+def _sse(*lines):
+    """Render lines as a block of SSE data frames, encoded once"""
+    return "".join(f"data: {line}\n\n" for line in lines).encode('utf-8')
+
+def _coalesce(script):
+    """
+    Merge (bytes, delay) steps that have no pause between them, so every
+    write to the client is one frame block followed by one sleep.
+    """
+    merged = []
+    pending = b""
+    for blob, delay in script:
+        pending += blob
+        if delay:
+            merged.append((pending, delay))
+            pending = b""
+    if pending:
+        merged.append((pending, 0))
+    return tuple(merged)
+
+def _interview_answers(persona_type):
+    """Scripted answers to the first two feedback questions for a persona"""
+    if persona_type == "tech_enthusiast":
+        return (
+            "I'm generally satisfied with the technical specifications provided, but I wish there were more detailed comparison tools.",
+            "Finding compatibility information between products is challenging. I often have to research elsewhere."
+        )
+    if persona_type == "budget_shopper":
+        return (
+            "I like the price filtering options, but sometimes shipping costs aren't clear until checkout which is frustrating.",
+            "The coupon system is confusing. Sometimes discounts don't apply as expected."
+        )
+    return (
+        "Gift options are limited and it's hard to schedule delivery for specific dates.",
+        "Gift wrapping options are hard to find, and I can't add personalized messages easily."
+    )
+
+def _build_clean_agents_script():
+    """
+    Pre-render the static parts of the clean agents flow.
+
+    Returns the phases before and after the persona interviews as
+    (bytes, delay) pairs. The interviews themselves come from _PERSONA_SSE.
+    """
+    context = COMPANY_AGENT_WORK["company_context_agent"]
+    data_agent = COMPANY_AGENT_WORK["data_agent"]
+    personas = _PERSONA_KEYS
+
+    phases = [
+        (_sse("🚀 Starting Enhanced MercadoLivre Agent Analysis with Interactive Flow..."), 0.5),
+        # Phase 1: Company Context Agent Analysis
+        (_sse(
+            "🏢 Phase 1: Company Context Agent Gathering Market Intelligence...",
+            THICK_RULE,
+            "📊 Company Context Agent Analyzing Market Data...",
+            "• Analyzing marketplace structure and user behavior patterns",
+            "• Mapping product categories and search algorithms",
+            "• Evaluating competitor strategies and positioning"
+        ), 1.0),
+        (_sse(
+            "\n📈 Company Context Agent Market Analysis Results:",
+            *[f"• {insight}" for insight in context["analysis"][:3]],
+            "\n💼 Company Context Agent Sending Context to Feedback Collection Agent:",
+            *[f"➤ {item}" for item in context["context_provided"][:3]],
+            THICK_RULE
+        ), 1.0),
+        # Phase 2: Feedback Collection Agent Preparation
+        (_sse(
+            "🎙️ Phase 2: Feedback Collection Agent Preparing Research...",
+            THICK_RULE,
+            "📝 Feedback Collection Agent Planning Research Based on Market Context...",
+            "• Developing structured interview questions based on market context",
+            "• Selecting representative user personas for research",
+            "• Preparing survey instruments and usability tests",
+            "\n❓ Feedback Collection Agent Preparing Interview Questions:",
+            *[f"• \"{question}\"" for question in SURVEY_QUESTIONS]
+        ), 1.0),
+        (_sse(
+            "\n👥 Feedback Collection Agent Loading Diverse Personas...",
+            f"Loaded {len(personas)} diverse personas for interviews",
+            *[f"• {_PERSONA_TITLES[persona]} - Ready for interview" for persona in personas],
+            THICK_RULE,
+            # Phase 3: Feedback Collection Agent Conducting Interviews
+            "🔍 Phase 3: Feedback Collection Agent Conducting Interviews..."
+        ), 1.0)
+    ]
+
+    wrapup = [
+        # Phase 4: Feedback Collection Agent Processing and Sending to Data Agent
+        (_sse(
+            "📊 Phase 4: Feedback Collection Agent Processing Results...",
+            THICK_RULE,
+            "• Consolidating interview responses across all personas",
+            "• Identifying patterns in user feedback",
+            "• Preparing data package for Data Agent analysis"
+        ), 1.0),
+        (_sse(
+            "\n📤 Feedback Collection Agent Sending Processed Data to Data Agent:",
+            "• Interview transcripts from 3 distinct persona types",
+            "• Survey responses with satisfaction metrics",
+            "• Observed behaviors and decision patterns",
+            "• Feature request and pain point documentation",
+            THICK_RULE
+        ), 0.5),
+        # Phase 5: Data Agent Analysis
+        (_sse(
+            "📈 Phase 5: Data Agent Analyzing Feedback Data...",
+            THICK_RULE,
+            "• Processing received data from Feedback Collection Agent",
+            "• Integrating with market context from Company Context Agent",
+            "• Running statistical analysis on user behavior patterns"
+        ), 1.0),
+        (_sse(
+            "\n🔬 Data Agent Analysis Results:",
+            *[f"• {analysis}" for analysis in data_agent["analysis"]],
+            "\n💡 Key Insights Generated:",
+            *[f"➤ {insight}" for insight in data_agent["insights"]],
+            THICK_RULE
+        ), 0.5),
+        # Phase 6: Synthesis and Recommendations
+        (_sse(
+            "🏆 Phase 6: Generating Final Recommendations...",
+            "• Consolidating insights from all three agents",
+            "• Prioritizing recommendations based on business impact",
+            "• Formulating implementation roadmap"
+        ), 1.0),
+        (_sse(
+            "\n📊 Final Prioritized Recommendations:",
+            *[f"{i}. {rec}" for i, rec in enumerate(FINAL_RECOMMENDATIONS, 1)]
+        ), 0.5),
         # Summary
-        yield f"data: \n🎯 INTERACTIVE AGENT ANALYSIS COMPLETE\n\n"
-        yield f"data: ══════════════════════════════════════════════════\n\n"
-        yield f"data: ✅ Company Context Agent: Market analysis completed\n\n"
-        yield f"data: ✅ Feedback Collection Agent: {len(personas)} personas interviewed\n\n"
-        yield f"data: ✅ Data Agent: {len(COMPANY_AGENT_WORK['data_agent']['insights'])} key insights generated\n\n"
-        yield f"data: ✅ Total Recommendations: {len(recommendations)}\n\n"
-        yield f"data: ✅ Analysis Status: COMPLETE\n\n"
-        yield f"data: ══════════════════════════════════════════════════\n\n"
+        (_sse(
+            "\n🎯 INTERACTIVE AGENT ANALYSIS COMPLETE",
+            WIDE_RULE,
+            "✅ Company Context Agent: Market analysis completed",
+            f"✅ Feedback Collection Agent: {len(personas)} personas interviewed",
+            f"✅ Data Agent: {len(data_agent['insights'])} key insights generated",
+            f"✅ Total Recommendations: {len(FINAL_RECOMMENDATIONS)}",
+            "✅ Analysis Status: COMPLETE",
+            WIDE_RULE
+        ), 0)
+    ]
+
+    return _coalesce(phases), _coalesce(wrapup)
+
+_CLEAN_AGENTS_PHASES, _CLEAN_AGENTS_WRAPUP = _build_clean_agents_script()
+
+# Pre-rendered interview sections per persona type
+_PERSONA_SSE = {}
+
+def _precompute():
+    """
+    Render each persona's interview sections to SSE bytes once at import.
 
-    return Response(generate(), mimetype='text/plain')
+    Only the per-persona insight tally is random, so it is appended at
+    request time after the "interview" blob.
+    """
+    questions = SURVEY_QUESTIONS[:2]
+    for persona_type, data in PERSONA_INTERACTIONS.items():
+        persona_name = _PERSONA_TITLES[persona_type]
+        answers = _interview_answers(persona_type)
+        qa_lines = []
+        for i, (question, answer) in enumerate(zip(questions, answers), 1):
+            qa_lines.append(f"Q{i}: \"{question}\"")
+            qa_lines.append(f"A{i}: \"{answer}\"")
+
+        sections = {
+            "header": _sse("", f"🤖 Interviewing {persona_name} Persona...", THIN_RULE),
+            "questions_block": _sse("💬 Feedback Collection Agent Questions:", *qa_lines),
+            "behaviors_head2": _sse(
+                "\n📋 Observed Shopping Behaviors:",
+                *[f"• {behavior}" for behavior in data["behaviors"][:2]]
+            ),
+            "decisions_head2": _sse(
+                "\n✅ Key Decision Patterns Identified:",
+                *[f"➤ {decision}" for decision in data["decisions"][:2]]
+            )
+        }
+        sections["interview"] = b"".join((
+            sections["header"],
+            sections["questions_block"],
+            sections["behaviors_head2"],
+            sections["decisions_head2"]
+        ))
+        _PERSONA_SSE[persona_type] = sections
+
+_precompute()
+
+# Closing line of each interview, keyed by the random insight count
+_INSIGHT_TALLIES = {
+    observations: _sse(f"\n📊 Total Insights Collected: {observations}", THIN_RULE)
+    for observations in range(3, 8)
+}
+
+SIMULATION_PHASES = [
+    "📊 Phase 1: Gathering MercadoLivre Context...",
+    "👥 Phase 2: Loading Diverse Personas...",
+    "🎯 Phase 3: Planning Persona-Based Exploration Strategy...",
+    "🔍 Phase 4: Executing Multi-Persona Parallel Exploration...",
+    "📊 Phase 5: Synthesizing Multi-Persona Feedback...",
+    "🏢 Phase 6: Company Analysis & Departmental Recommendations...",
+    "✅ Phase 7: Quality Validation and Final Report..."
+]
+
+SIMULATION_PERSONAS = ["Tech Enthusiast Alex", "Budget Shopper Maria", "Gift Buyer Carlos"]
+
+def _build_simulation_script():
+    """
+    Build the /run-simulation stream as (bytes, delay) pairs.
+
+    Nothing in the simulation depends on the request, so the whole script
+    is rendered once at import.
+    """
+    script = [(_sse("[Simulation] 🎭 Starting MercadoLivre Agent Simulation..."), 1)]
+
+    for i, phase in enumerate(SIMULATION_PHASES):
+        if i == 1:
+            script.append((_sse(phase), 2))
+            script.append((_sse(
+                "Loaded 3 diverse personas for exploration",
+                "Persona Distribution:",
+                "  - Brief explorers (5-10 min): 1",
+                "  - Medium explorers (15-25 min): 1",
+                "  - Thorough explorers (30-50 min): 1"
+            ), 1))
+        elif i == 3:
+            script.append((_sse(phase), 2))
+            script.extend(
+                (_sse(f"Starting exploration as {persona}..."), 1)
+                for persona in SIMULATION_PERSONAS
+            )
+            script.append((_sse("📋 Phase 4 Results: Persona Exploration Summary"), 0))
+            script.extend(
+                (_sse(f"✅ {persona}: {j + 2} observations"), 0.5)
+                for j, persona in enumerate(SIMULATION_PERSONAS)
+            )
+            script[-1] = (script[-1][0], 1.5)
+        else:
+            script.append((_sse(phase), 3))
+
+    script.append((_sse("[Complete] 🎯 MERCADOLIVRE DIVERSE PERSONA ANALYSIS COMPLETE"), 0))
+    return _coalesce(script)
+
+_SIM_SCRIPT = _build_simulation_script()
+
+@dataclass
+class _PacedStream:
+    """One client's position in a (bytes, delay) script"""
+    steps: object
+    out: queue.Queue
+    cancelled: bool = False
+
+class _Pacer:
+    """
+    A single timer thread that paces every scripted stream.
+
+    Streams wait in a heap ordered by the deadline of their next step. When
+    a step comes due the thread hands its bytes to that stream's queue, so
+    request threads block on their own queue instead of each running a
+    sleep timer.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._order = itertools.count()
+        self._wakeup = threading.Condition()
+        self._thread = None
+
+    def _start_thread(self):
+        """Start the timer thread; the caller holds self._wakeup"""
+        self._thread = threading.Thread(target=self._run, name="sse-pacer", daemon=True)
+        self._thread.start()
+
+    def _schedule(self, deadline, stream):
+        with self._wakeup:
+            if self._thread is None:
+                self._start_thread()
+            heapq.heappush(self._heap, (deadline, next(self._order), stream))
+            self._wakeup.notify()
+
+    def _run(self):
+        try:
+            while True:
+                with self._wakeup:
+                    while not self._heap:
+                        self._wakeup.wait()
+                    deadline, _, stream = self._heap[0]
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        self._wakeup.wait(remaining)
+                        continue
+                    heapq.heappop(self._heap)
+
+                if stream.cancelled:
+                    continue
+                try:
+                    step = next(stream.steps, None)
+                    if step is None:
+                        stream.out.put(None)
+                        continue
+                    blob, delay = step
+                    stream.out.put(blob)
+                    self._schedule(time.monotonic() + delay, stream)
+                except Exception:
+                    # One broken script must not stall every other stream
+                    app.logger.exception("Dropping scripted stream after a failed step")
+                    stream.out.put(None)
+        finally:
+            with self._wakeup:
+                self._thread = None
+                # Streams still waiting would otherwise never be released
+                if self._heap:
+                    self._start_thread()
+
+    def play(self, script):
+        """Yield the script's blobs as the timer thread releases them"""
+        stream = _PacedStream(steps=iter(script), out=queue.Queue())
+        self._schedule(time.monotonic(), stream)
+        try:
+            while True:
+                try:
+                    blob = stream.out.get(timeout=PACER_STALL_TIMEOUT)
+                except queue.Empty:
+                    app.logger.warning("Scripted stream stalled; closing it")
+                    return
+                if blob is None:
+                    return
+                yield blob
+        finally:
+            # A client that disconnects drops out at its next deadline
+            stream.cancelled = True
+
+_PACER = _Pacer()
+
+def _play(script):
+    """Stream a pre-rendered (bytes, delay) script on the shared pacer"""
+    return _PACER.play(script)
+
+DASHBOARD_HTML_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'admin_dashboard.html')
+
+def _load_dashboard_html():
+    """Read the dashboard page and derive its ETag"""
+    with open(DASHBOARD_HTML_PATH, 'rb') as f:
+        html = f.read()
+    return html, hashlib.blake2b(html, digest_size=8).hexdigest()
+
+_DASHBOARD_HTML, _DASHBOARD_ETAG = _load_dashboard_html()
+
+@app.route('/')
+def dashboard():
+    """Serve the dashboard HTML file"""
+    if app.debug:
+        # Pick up edits to the page without restarting the server
+        html, etag = _load_dashboard_html()
+    else:
+        html, etag = _DASHBOARD_HTML, _DASHBOARD_ETAG
+
+    response = Response(html, mimetype='text/html')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'max-age=30, must-revalidate'
+    return response.make_conditional(request)
+
+@app.route('/run-clean-agents', methods=['POST'])
+def run_clean_agents():
+    """Run an interactive agent flow simulation with detailed interactions"""
+    interviews = tuple(
+        (_PERSONA_SSE[persona_type]["interview"] + _INSIGHT_TALLIES[random.randint(3, 7)],
+         INTERVIEW_DELAY)
+        for persona_type in _PERSONA_KEYS
+    )
+    script = _CLEAN_AGENTS_PHASES + interviews + _CLEAN_AGENTS_WRAPUP
+    return Response(_play(script), direct_passthrough=True)
+
+# Raw subprocess lines are matched as bytes to skip a decode per line
+AGENT_OUTPUT_REJECT = (
+    b'NotOpenSSLWarning',
+    b'urllib3',
+    b'warnings.warn',
+    b'ml_websocket_client',
+    b'Connection failed',
+    b'Cannot send message',
+    b'Cannot receive messages',
+    b'object AsyncMock',
+    b'AssertionError',
+    b'Traceback',
+    b'File "/',
+    b'ERROR:',
+    b'FAIL:',
+    b'test_connect',
+    b'test_disconnect',
+    b'test_receive_messages',
+    b'test_send_message',
+    b'test_explore_with_persona_error_handling'
+)
+
+AGENT_OUTPUT_KEEP = (
+    b'test_', b'...', b'ok', b'Starting exploration', b'Phase',
+    b'Loaded', b'observations', b'Analysis', b'Complete',
+    b'Ran', b'Total', b'Brief', b'Medium', b'Thorough'
+)
+
+# One alternation per list so each line is scanned once by the regex engine
+_REJECT_RE = re.compile(b'|'.join(map(re.escape, AGENT_OUTPUT_REJECT)))
+_KEEP_RE = re.compile(b'|'.join(map(re.escape, AGENT_OUTPUT_KEEP)))
+
+# Agent test run launched by /run-agents; cwd is passed to Popen rather
+# than changing the server's own working directory
+PROJECT_ROOT = '/Users/rodrigosalvador/Documents/Konv-agent'
+AGENTS_PYTHON = os.path.join(PROJECT_ROOT, 'python-agents', 'env', 'bin', 'python')
+AGENTS_SCRIPT = os.path.join(PROJECT_ROOT, 'python-agents', 'run_tests.py')
+
+AGENTS_STARTING = _sse("[Starting] Running MercadoLivre AI Agent Tests...")
+AGENTS_COMPLETE = _sse("[Complete] ✅ Agent system analysis completed successfully!")
+
+# SSE comment frame; the dashboard only acts on "data: " lines
+KEEPALIVE = b": keepalive\n\n"
+
+def _pump(stream, lines):
+    """Copy a subprocess pipe into a queue line by line, ending with None"""
+    try:
+        for line in iter(stream.readline, b''):
+            lines.put(line)
+    finally:
+        lines.put(None)
 
 @app.route('/run-agents', methods=['POST'])
 def run_agents():
     """Run the real agent system with filtered output"""
-    global current_process, is_running
-    
-    if is_running:
-        return jsonify({"error": "Agent system is already running"}), 400
-    
-    def generate():
-        global current_process, is_running
-        is_running = True
-        
+    global _JOB
+
+    with _JOB_LOCK:
+        if _JOB is not None and _JOB.running:
+            return jsonify({"error": "Agent system is already running"}), 400
+
         try:
-            # Change to the correct directory and activate venv
-            os.chdir('/Users/rodrigosalvador/Documents/Konv-agent')
-
-            # Run the agent system
-            cmd = [
-                'bash', '-c',
-                'source python-agents/env/bin/activate && python python-agents/run_tests.py'
-            ]
-            
-            current_process = subprocess.Popen(
-                cmd,
+            # Run the agent system with the project's venv interpreter
+            proc = subprocess.Popen(
+                [AGENTS_PYTHON, AGENTS_SCRIPT],
+                cwd=PROJECT_ROOT,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+                bufsize=1 << 20,
+                env={**os.environ, 'PYTHONUNBUFFERED': '1'}
             )
+        except Exception as e:
+            return Response(_sse(f"[Error] ❌ Failed to run agent system: {str(e)}"))
+
+        job = _JOB = AgentJob(proc)
+
+    # A new agent run makes the cached survey snapshot stale
+    invalidate_survey_cache()
+    
+    def generate():
+        global _JOB
+        
+        try:
+            # Read the pipe on a separate thread so a quiet subprocess never
+            # pins this generator inside a blocking read
+            lines = queue.Queue()
+            threading.Thread(
+                target=_pump, args=(proc.stdout, lines), daemon=True
+            ).start()
             
-            yield f"data: [Starting] Running MercadoLivre AI Agent Tests...\n\n"
-            
-            # Filter out unwanted error messages
-            error_filters = [
-                'NotOpenSSLWarning',
-                'urllib3',
-                'warnings.warn',
-                'ml_websocket_client',
-                'Connection failed',
-                'Cannot send message',
-                'Cannot receive messages',
-                'object AsyncMock',
-                'AssertionError',
-                'Traceback',
-                'File "/',
-                'ERROR:',
-                'FAIL:',
-                'test_connect',
-                'test_disconnect', 
-                'test_receive_messages',
-                'test_send_message',
-                'test_explore_with_persona_error_handling'
-            ]
+            yield AGENTS_STARTING
             
             # Stream filtered output line by line
-            for line in current_process.stdout:
+            while True:
+                try:
+                    line = lines.get(timeout=0.5)
+                except queue.Empty:
+                    yield KEEPALIVE
+                    continue
+                if line is None:
+                    break
                 line = line.strip()
-                if line and not any(filter_text in line for filter_text in error_filters):
-                    # Only show meaningful test results and agent output
-                    if any(keep_text in line for keep_text in [
-                        'test_', '...', 'ok', 'Starting exploration', 'Phase', 
-                        'Loaded', 'observations', 'Analysis', 'Complete',
-                        'Ran', 'Total', 'Brief', 'Medium', 'Thorough'
-                    ]):
-                        yield f"data: {line}\n\n"
-                        time.sleep(0.1)
+                # Only show meaningful test results and agent output
+                if _KEEP_RE.search(line) and not _REJECT_RE.search(line):
+                    yield b"data: " + line + b"\n\n"
             
             # Wait for process to complete
-            current_process.wait()
+            proc.wait()
             
-            if current_process.returncode in [0, 1]:  # Accept exit code 1 as success since core functionality works
-                yield f"data: [Complete] ✅ Agent system analysis completed successfully!\n\n"
+            if proc.returncode in [0, 1]:  # Accept exit code 1 as success since core functionality works
+                yield AGENTS_COMPLETE
             else:
-                yield f"data: [Error] ❌ Agent system completed with errors (exit code: {current_process.returncode})\n\n"
+                yield _sse(f"[Error] ❌ Agent system completed with errors (exit code: {proc.returncode})")
                 
         except Exception as e:
-            yield f"data: [Error] ❌ Failed to run agent system: {str(e)}\n\n"
+            yield _sse(f"[Error] ❌ Failed to run agent system: {str(e)}")
         finally:
-            is_running = False
-            current_process = None
+            with _JOB_LOCK:
+                # /stop may already have cleared it, or a new run replaced it
+                if _JOB is job:
+                    _JOB = None
     
-    return Response(generate(), mimetype='text/plain')
+    return Response(generate(), direct_passthrough=True)
 
 @app.route('/run-simulation', methods=['POST'])
 def run_simulation():
     """Run the simulation mode"""
-    def generate():
-        yield f"data: [Simulation] 🎭 Starting MercadoLivre Agent Simulation...\n\n"
-        time.sleep(1)
-        
-        # Simulate phases
-        phases = [
-            "📊 Phase 1: Gathering MercadoLivre Context...",
-            "👥 Phase 2: Loading Diverse Personas...", 
-            "🎯 Phase 3: Planning Persona-Based Exploration Strategy...",
-            "🔍 Phase 4: Executing Multi-Persona Parallel Exploration...",
-            "📊 Phase 5: Synthesizing Multi-Persona Feedback...",
-            "🏢 Phase 6: Company Analysis & Departmental Recommendations...",
-            "✅ Phase 7: Quality Validation and Final Report..."
-        ]
-        
-        for i, phase in enumerate(phases):
-            yield f"data: {phase}\n\n"
-            time.sleep(2)
-            
-            # Add some phase details
-            if i == 1:
-                yield f"data: Loaded 3 diverse personas for exploration\n\n"
-                yield f"data: Persona Distribution:\n\n"
-                yield f"data:   - Brief explorers (5-10 min): 1\n\n"
-                yield f"data:   - Medium explorers (15-25 min): 1\n\n"
-                yield f"data:   - Thorough explorers (30-50 min): 1\n\n"
-            elif i == 3:
-                personas = ["Tech Enthusiast Alex", "Budget Shopper Maria", "Gift Buyer Carlos"]
-                for persona in personas:
-                    yield f"data: Starting exploration as {persona}...\n\n"
-                    time.sleep(1)
-                yield f"data: 📋 Phase 4 Results: Persona Exploration Summary\n\n"
-                for j, persona in enumerate(personas):
-                    observations = j + 2
-                    yield f"data: ✅ {persona}: {observations} observations\n\n"
-                    time.sleep(0.5)
-            
-            time.sleep(1)
-        
-        yield f"data: [Complete] 🎯 MERCADOLIVRE DIVERSE PERSONA ANALYSIS COMPLETE\n\n"
-    
-    return Response(generate(), mimetype='text/plain')
+    return Response(_play(_SIM_SCRIPT), direct_passthrough=True)
 
 @app.route('/status')
 def status():
     """Get current system status"""
+    with _JOB_LOCK:
+        job = _JOB
+    running = job is not None and job.running
     return jsonify({
-        "running": is_running,
-        "process_id": current_process.pid if current_process else None
+        "running": running,
+        "process_id": job.proc.pid if running else None
     })
 
-@app.route('/survey-data')
-def survey_data():
-    """Get detailed survey data for all 120 users"""
-    # Create simulated survey data for 120 users
-    persona_types = list(PERSONA_INTERACTIONS.keys())
-    survey_results = []
+# Number of simulated users in the survey data
+SURVEY_USER_COUNT = 120
+
+# Survey response pools, by question kind and persona
+_TECH_SAT_RESPONSES = (
+    "7/10 - The technical specifications are good, but comparison tools are lacking.",
+    "8/10 - I appreciate the detailed specs, but wish I could compare products side-by-side.",
+    "6/10 - Finding compatibility information between products is challenging."
+)
+_BUDGET_SAT_RESPONSES = (
+    "6/10 - Good price filters, but shipping costs are often unclear until checkout.",
+    "5/10 - I like the discounts, but the coupon system is confusing.",
+    "7/10 - Overall good, but would like more transparency in pricing."
+)
+_GIFT_SAT_RESPONSES = (
+    "5/10 - Gift options are limited, especially for scheduled delivery.",
+    "6/10 - Gift wrapping options are hard to find.",
+    "4/10 - I struggle to find appropriate gifts by age group."
+)
+_TECH_DIFF_RESPONSES = (
+    "Finding compatibility information between different products",
+    "Comparing technical specifications across multiple items",
+    "Locating detailed performance benchmarks"
+)
+_BUDGET_DIFF_RESPONSES = (
+    "Understanding the total cost including shipping before checkout",
+    "Finding which coupons work with which products",
+    "Comparing prices across different sellers"
+)
+_GIFT_DIFF_RESPONSES = (
+    "Finding appropriate gift options for specific age groups",
+    "Locating gift wrapping services",
+    "Scheduling delivery for specific dates"
+)
+_TECH_CAT_RESPONSES = (
+    "Electronics - Too many filters but not the right ones",
+    "Computers - Difficult to find compatibility information",
+    "Smartphones - Hard to compare camera quality across models"
+)
+_BUDGET_CAT_RESPONSES = (
+    "Furniture - Shipping costs vary widely and aren't clear",
+    "Clothing - Discount calculations are confusing",
+    "Appliances - Hard to find budget options with good reviews"
+)
+_GIFT_CAT_RESPONSES = (
+    "Toys - Hard to filter by age appropriateness",
+    "Beauty products - Difficult to find gift sets",
+    "Electronics - No option to add gift message"
+)
+_TECH_PURCHASE_RESPONSES = (
+    "More detailed comparison tools for technical specifications",
+    "Better compatibility information between products",
+    "Expert reviews and benchmarks for electronics"
+)
+_BUDGET_PURCHASE_RESPONSES = (
+    "Clear total cost calculator including shipping before checkout",
+    "Simpler coupon system that shows eligible products",
+    "Price history charts to know if I'm getting a good deal"
+)
+_GIFT_PURCHASE_RESPONSES = (
+    "Gift recommendation engine based on recipient age/interests",
+    "Easy gift wrapping and messaging options",
+    "Ability to schedule delivery for birthdays and holidays"
+)
+_DEVICES = ("mobile", "desktop", "tablet")
+
+def _question_kind(question):
+    """Classify a survey question by the response pool it draws from, or None for free text"""
+    lowered = question.lower()
+    if "satisfaction" in lowered:
+        return "sat"
+    if "difficult" in lowered or "challenging" in lowered:
+        return "diff"
+    if "categories" in lowered:
+        return "cat"
+    if "purchase" in lowered:
+        return "purchase"
+    return None
+
+_Q_KIND = {question: _question_kind(question) for question in SURVEY_QUESTIONS}
+
+# (persona type, question kind) -> response pool; personas without their
+# own answers share the gift buyer's
+_RESPONSE_POOLS = {
+    (persona_type, kind): by_persona.get(persona_type, by_persona["gift_buyer"])
+    for kind, by_persona in {
+        "sat": {
+            "tech_enthusiast": _TECH_SAT_RESPONSES,
+            "budget_shopper": _BUDGET_SAT_RESPONSES,
+            "gift_buyer": _GIFT_SAT_RESPONSES
+        },
+        "diff": {
+            "tech_enthusiast": _TECH_DIFF_RESPONSES,
+            "budget_shopper": _BUDGET_DIFF_RESPONSES,
+            "gift_buyer": _GIFT_DIFF_RESPONSES
+        },
+        "cat": {
+            "tech_enthusiast": _TECH_CAT_RESPONSES,
+            "budget_shopper": _BUDGET_CAT_RESPONSES,
+            "gift_buyer": _GIFT_CAT_RESPONSES
+        },
+        "purchase": {
+            "tech_enthusiast": _TECH_PURCHASE_RESPONSES,
+            "budget_shopper": _BUDGET_PURCHASE_RESPONSES,
+            "gift_buyer": _GIFT_PURCHASE_RESPONSES
+        }
+    }.items()
+    for persona_type in _PERSONA_KEYS
+}
 
-    for i in range(120):
-        # Randomly assign persona type
-        persona_type = random.choice(persona_types)
-        persona_name = f"User {i+1}"
+# Free-text answer for questions without a response pool
+_GENERIC_RESPONSES = {question: f"Response to: {question[:30]}..." for question in SURVEY_QUESTIONS}
 
-        # Use the questions from Feedback Collection Agent
-        questions = COMPANY_AGENT_WORK["feedback_collection_agent"]["questions_asked"]
+def _draw_survey_answers(count):
+    """
+    Assign a persona to each of count users and answer every survey question.
 
-        # Generate survey responses
-        responses = {}
+    Draws are batched: one random.choices call for the assignments and one
+    per (persona, question) pool. Returns the assignments and a matching
+    list of response dicts.
+    """
+    questions = SURVEY_QUESTIONS
+    assignments = random.choices(_PERSONA_KEYS, k=count)
+    samples = {}
+    for persona_type, persona_count in Counter(assignments).items():
+        for question in questions:
+            kind = _Q_KIND[question]
+            if kind is not None:
+                pool = _RESPONSE_POOLS[(persona_type, kind)]
+                samples[(persona_type, question)] = iter(random.choices(pool, k=persona_count))
 
-        # Generate appropriate responses based on persona type
+    answers = []
+    for persona_type in assignments:
+        responses = {}
         for question in questions:
-            if "satisfaction" in question.lower():
-                if persona_type == "tech_enthusiast":
-                    responses[question] = random.choice([
-                        "7/10 - The technical specifications are good, but comparison tools are lacking.",
-                        "8/10 - I appreciate the detailed specs, but wish I could compare products side-by-side.",
-                        "6/10 - Finding compatibility information between products is challenging."
-                    ])
-                elif persona_type == "budget_shopper":
-                    responses[question] = random.choice([
-                        "6/10 - Good price filters, but shipping costs are often unclear until checkout.",
-                        "5/10 - I like the discounts, but the coupon system is confusing.",
-                        "7/10 - Overall good, but would like more transparency in pricing."
-                    ])
-                else:  # gift_buyer
-                    responses[question] = random.choice([
-                        "5/10 - Gift options are limited, especially for scheduled delivery.",
-                        "6/10 - Gift wrapping options are hard to find.",
-                        "4/10 - I struggle to find appropriate gifts by age group."
-                    ])
-            elif "difficult" in question.lower() or "challenging" in question.lower():
-                if persona_type == "tech_enthusiast":
-                    responses[question] = random.choice([
-                        "Finding compatibility information between different products",
-                        "Comparing technical specifications across multiple items",
-                        "Locating detailed performance benchmarks"
-                    ])
-                elif persona_type == "budget_shopper":
-                    responses[question] = random.choice([
-                        "Understanding the total cost including shipping before checkout",
-                        "Finding which coupons work with which products",
-                        "Comparing prices across different sellers"
-                    ])
-                else:  # gift_buyer
-                    responses[question] = random.choice([
-                        "Finding appropriate gift options for specific age groups",
-                        "Locating gift wrapping services",
-                        "Scheduling delivery for specific dates"
-                    ])
-            elif "categories" in question.lower():
-                if persona_type == "tech_enthusiast":
-                    responses[question] = random.choice([
-                        "Electronics - Too many filters but not the right ones",
-                        "Computers - Difficult to find compatibility information",
-                        "Smartphones - Hard to compare camera quality across models"
-                    ])
-                elif persona_type == "budget_shopper":
-                    responses[question] = random.choice([
-                        "Furniture - Shipping costs vary widely and aren't clear",
-                        "Clothing - Discount calculations are confusing",
-                        "Appliances - Hard to find budget options with good reviews"
-                    ])
-                else:  # gift_buyer
-                    responses[question] = random.choice([
-                        "Toys - Hard to filter by age appropriateness",
-                        "Beauty products - Difficult to find gift sets",
-                        "Electronics - No option to add gift message"
-                    ])
-            elif "purchase" in question.lower():
-                if persona_type == "tech_enthusiast":
-                    responses[question] = random.choice([
-                        "More detailed comparison tools for technical specifications",
-                        "Better compatibility information between products",
-                        "Expert reviews and benchmarks for electronics"
-                    ])
-                elif persona_type == "budget_shopper":
-                    responses[question] = random.choice([
-                        "Clear total cost calculator including shipping before checkout",
-                        "Simpler coupon system that shows eligible products",
-                        "Price history charts to know if I'm getting a good deal"
-                    ])
-                else:  # gift_buyer
-                    responses[question] = random.choice([
-                        "Gift recommendation engine based on recipient age/interests",
-                        "Easy gift wrapping and messaging options",
-                        "Ability to schedule delivery for birthdays and holidays"
-                    ])
+            sample = samples.get((persona_type, question))
+            if sample is not None:
+                responses[question] = next(sample)
             else:
                 # Generic response for other questions
-                responses[question] = f"Response to: {question[:30]}..."
-
-        # Add timestamp
-        timestamp = f"2023-{random.randint(1,12):02d}-{random.randint(1,28):02d} {random.randint(8,20):02d}:{random.randint(0,59):02d}"
-
-        survey_results.append({
+                responses[question] = _GENERIC_RESPONSES[question]
+        answers.append(responses)
+    return assignments, answers
+
+def _survey_records():
+    """Yield simulated survey records, one per user"""
+    count = SURVEY_USER_COUNT
+
+    # Draw every random field in batches rather than once per user
+    assignments, answers = _draw_survey_answers(count)
+    months = random.choices(range(1, 13), k=count)
+    days = random.choices(range(1, 29), k=count)
+    hours = random.choices(range(8, 21), k=count)
+    minutes = random.choices(range(0, 60), k=count)
+    time_spent = random.choices(range(5, 26), k=count)
+    devices = random.choices(_DEVICES, k=count)
+
+    for i, (persona_type, responses) in enumerate(zip(assignments, answers)):
+        yield {
             "user_id": f"user_{i+1}",
             "persona_type": persona_type,
-            "name": persona_name,
-            "timestamp": timestamp,
+            "name": f"User {i+1}",
+            "timestamp": f"2023-{months[i]:02d}-{days[i]:02d} {hours[i]:02d}:{minutes[i]:02d}",
             "responses": responses,
-            "time_spent_minutes": random.randint(5, 25),
-            "device": random.choice(["mobile", "desktop", "tablet"]),
+            "time_spent_minutes": time_spent[i],
+            "device": devices[i],
             "completed": True
-        })
+        }
 
-    return jsonify({
-        "survey_count": len(survey_results),
-        "surveys": survey_results
-    })
+def _stream_survey():
+    """Encode the survey payload one user at a time"""
+    yield b'{"survey_count": %d, "surveys": [' % SURVEY_USER_COUNT
+    for i, record in enumerate(_survey_records()):
+        if i:
+            yield b", "
+        yield _dumps_bytes(record)
+    yield b"]}"
+
+# Seconds a generated survey payload is reused before drawing a new one
+SURVEY_CACHE_TTL = 60
+
+# (payload bytes, monotonic expiry) of the last full survey, or None
+_survey_cache = None
+_SURVEY_CACHE_LOCK = threading.Lock()
+
+def _cached_survey():
+    """Return the cached survey payload if it has not expired"""
+    with _SURVEY_CACHE_LOCK:
+        cached = _survey_cache
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+    return None
+
+def _stream_and_cache_survey():
+    """Stream a fresh survey and keep the complete payload for later hits"""
+    global _survey_cache
+    chunks = []
+    for chunk in _stream_survey():
+        chunks.append(chunk)
+        yield chunk
+    with _SURVEY_CACHE_LOCK:
+        _survey_cache = (b"".join(chunks), time.monotonic() + SURVEY_CACHE_TTL)
+
+def invalidate_survey_cache():
+    """Drop the cached survey so the next request draws a new one"""
+    global _survey_cache
+    with _SURVEY_CACHE_LOCK:
+        _survey_cache = None
 
-@app.route('/ai-analysis')
-def ai_analysis():
-    """
-    AI-powered analysis of survey responses with categorization, insights, and recommendations
-    by department.
-    """
-    # Define categories for classification
-    categories = {
-        "ui_ux": [
-            "interface", "navigation", "filter", "search", "compare", "layout", "design",
-            "usability", "accessibility", "find", "locate", "difficult", "confusing"
-        ],
-        "pricing_transparency": [
-            "price", "cost", "shipping", "total", "fee", "discount", "coupon", "unclear",
-            "hidden", "calculation", "transparency", "budget"
-        ],
-        "product_information": [
-            "specification", "specs", "detail", "description", "information", "compatibility",
-            "technical", "comparison", "review", "benchmark", "quality"
-        ],
-        "checkout_payment": [
-            "checkout", "payment", "cart", "purchase", "transaction", "installment", "credit",
-            "debit", "pix", "process"
-        ],
-        "delivery_logistics": [
-            "delivery", "shipping", "schedule", "date", "time", "tracking", "logistics",
-            "timing", "arrival"
-        ],
-        "gifting_experience": [
-            "gift", "wrapping", "message", "recommendation", "suggestion", "occasion",
-            "birthday", "holiday", "personalization"
-        ],
-        "mobile_experience": [
-            "mobile", "app", "phone", "tablet", "responsive", "screen", "size"
-        ]
-    }
+@app.route('/survey-data')
+def survey_data():
+    """Get detailed survey data for all 120 users"""
+    payload = _cached_survey()
+    if payload is not None:
+        return Response(payload, mimetype='application/json')
+    return Response(_stream_and_cache_survey(), mimetype='application/json')
+
+# Keyword vocabularies used to classify survey responses
+FEEDBACK_CATEGORIES = {
+    "ui_ux": [
+        "interface", "navigation", "filter", "search", "compare", "layout", "design",
+        "usability", "accessibility", "find", "locate", "difficult", "confusing"
+    ],
+    "pricing_transparency": [
+        "price", "cost", "shipping", "total", "fee", "discount", "coupon", "unclear",
+        "hidden", "calculation", "transparency", "budget"
+    ],
+    "product_information": [
+        "specification", "specs", "detail", "description", "information", "compatibility",
+        "technical", "comparison", "review", "benchmark", "quality"
+    ],
+    "checkout_payment": [
+        "checkout", "payment", "cart", "purchase", "transaction", "installment", "credit",
+        "debit", "pix", "process"
+    ],
+    "delivery_logistics": [
+        "delivery", "shipping", "schedule", "date", "time", "tracking", "logistics",
+        "timing", "arrival"
+    ],
+    "gifting_experience": [
+        "gift", "wrapping", "message", "recommendation", "suggestion", "occasion",
+        "birthday", "holiday", "personalization"
+    ],
+    "mobile_experience": [
+        "mobile", "app", "phone", "tablet", "responsive", "screen", "size"
+    ]
+}
 
-    # Department mappings
-    departments = {
-        "ui_ux": "Product & Design",
-        "pricing_transparency": "Finance & Pricing",
-        "product_information": "Catalog Management",
-        "checkout_payment": "Payments & Transactions",
-        "delivery_logistics": "Logistics & Delivery",
-        "gifting_experience": "Customer Experience",
-        "mobile_experience": "Mobile Development"
-    }
+# Department that owns each feedback category
+CATEGORY_DEPARTMENTS = {
+    "ui_ux": "Product & Design",
+    "pricing_transparency": "Finance & Pricing",
+    "product_information": "Catalog Management",
+    "checkout_payment": "Payments & Transactions",
+    "delivery_logistics": "Logistics & Delivery",
+    "gifting_experience": "Customer Experience",
+    "mobile_experience": "Mobile Development"
+}
 
-    # Get survey data
-    persona_types = list(PERSONA_INTERACTIONS.keys())
-    survey_results = []
+# Words of four or more letters, and the common ones not worth reporting
+WORD_RE = re.compile(r"[a-z]{4,}")
+STOPWORDS = frozenset({"with", "this", "that", "have", "more", "from", "very", "would", "about", "there"})
 
-    for i in range(120):
-        # Randomly assign persona type
-        persona_type = random.choice(persona_types)
-        persona_name = f"User {i+1}"
+# Sentiment vocabularies, matched against whole tokens of a response
+TOKEN_RE = re.compile(r"[a-z]+")
+POSITIVE_WORDS = frozenset({"good", "great", "like", "appreciate", "helpful", "easy", "useful", "satisfied"})
+NEGATIVE_WORDS = frozenset({"bad", "difficult", "confusing", "unclear", "hard", "frustrating", "disappointing", "lacking"})
 
-        # Use the questions from Feedback Collection Agent
-        questions = COMPANY_AGENT_WORK["feedback_collection_agent"]["questions_asked"]
+def _index_keywords():
+    """Map each keyword to the categories that list it ("shipping" has two)"""
+    index = {}
+    for category, keywords in FEEDBACK_CATEGORIES.items():
+        for keyword in keywords:
+            index[keyword] = index.get(keyword, ()) + (category,)
+    return index
 
-        # Generate survey responses
-        responses = {}
+KEYWORD_CATEGORIES = _index_keywords()
 
-        # Generate appropriate responses based on persona type
-        for question in questions:
-            if "satisfaction" in question.lower():
-                if persona_type == "tech_enthusiast":
-                    responses[question] = random.choice([
-                        "7/10 - The technical specifications are good, but comparison tools are lacking.",
-                        "8/10 - I appreciate the detailed specs, but wish I could compare products side-by-side.",
-                        "6/10 - Finding compatibility information between products is challenging."
-                    ])
-                elif persona_type == "budget_shopper":
-                    responses[question] = random.choice([
-                        "6/10 - Good price filters, but shipping costs are often unclear until checkout.",
-                        "5/10 - I like the discounts, but the coupon system is confusing.",
-                        "7/10 - Overall good, but would like more transparency in pricing."
-                    ])
-                else:  # gift_buyer
-                    responses[question] = random.choice([
-                        "5/10 - Gift options are limited, especially for scheduled delivery.",
-                        "6/10 - Gift wrapping options are hard to find.",
-                        "4/10 - I struggle to find appropriate gifts by age group."
-                    ])
-            elif "difficult" in question.lower() or "challenging" in question.lower():
-                if persona_type == "tech_enthusiast":
-                    responses[question] = random.choice([
-                        "Finding compatibility information between different products",
-                        "Comparing technical specifications across multiple items",
-                        "Locating detailed performance benchmarks"
-                    ])
-                elif persona_type == "budget_shopper":
-                    responses[question] = random.choice([
-                        "Understanding the total cost including shipping before checkout",
-                        "Finding which coupons work with which products",
-                        "Comparing prices across different sellers"
-                    ])
-                else:  # gift_buyer
-                    responses[question] = random.choice([
-                        "Finding appropriate gift options for specific age groups",
-                        "Locating gift wrapping services",
-                        "Scheduling delivery for specific dates"
-                    ])
-            elif "categories" in question.lower():
-                if persona_type == "tech_enthusiast":
-                    responses[question] = random.choice([
-                        "Electronics - Too many filters but not the right ones",
-                        "Computers - Difficult to find compatibility information",
-                        "Smartphones - Hard to compare camera quality across models"
-                    ])
-                elif persona_type == "budget_shopper":
-                    responses[question] = random.choice([
-                        "Furniture - Shipping costs vary widely and aren't clear",
-                        "Clothing - Discount calculations are confusing",
-                        "Appliances - Hard to find budget options with good reviews"
-                    ])
-                else:  # gift_buyer
-                    responses[question] = random.choice([
-                        "Toys - Hard to filter by age appropriateness",
-                        "Beauty products - Difficult to find gift sets",
-                        "Electronics - No option to add gift message"
-                    ])
-            elif "purchase" in question.lower():
-                if persona_type == "tech_enthusiast":
-                    responses[question] = random.choice([
-                        "More detailed comparison tools for technical specifications",
-                        "Better compatibility information between products",
-                        "Expert reviews and benchmarks for electronics"
-                    ])
-                elif persona_type == "budget_shopper":
-                    responses[question] = random.choice([
-                        "Clear total cost calculator including shipping before checkout",
-                        "Simpler coupon system that shows eligible products",
-                        "Price history charts to know if I'm getting a good deal"
-                    ])
-                else:  # gift_buyer
-                    responses[question] = random.choice([
-                        "Gift recommendation engine based on recipient age/interests",
-                        "Easy gift wrapping and messaging options",
-                        "Ability to schedule delivery for birthdays and holidays"
-                    ])
-            else:
-                # Generic response for other questions
-                responses[question] = f"Response to: {question[:30]}..."
+# Category position, used to break score ties in favour of the earlier one
+CATEGORY_RANK = {category: rank for rank, category in enumerate(FEEDBACK_CATEGORIES)}
 
-        survey_results.append({
-            "persona_type": persona_type,
-            "responses": responses
-        })
+# One pass over the text finds every keyword occurrence; the zero-width
+# lookahead also reports keywords inside another, such as "app" in
+# "wrapping", matching the old per-keyword substring test
+ALL_KEYWORDS_RE = re.compile("(?=(%s))" % "|".join(map(re.escape, KEYWORD_CATEGORIES)))
 
-    # Flatten responses for analysis
+# Seconds between background refreshes of the /ai-analysis result
+AI_ANALYSIS_TTL = 60
+
+def _compute_ai_analysis():
+    """
+    AI-powered analysis of survey responses with categorization, insights, and recommendations
+    by department.
+    """
+    # Get survey data
+    assignments, answers = _draw_survey_answers(SURVEY_USER_COUNT)
+    survey_results = [
+        {"persona_type": persona_type, "responses": responses}
+        for persona_type, responses in zip(assignments, answers)
+    ]
+    questions = SURVEY_QUESTIONS
+
+    # Flatten responses for analysis, keeping the lowercased text the
+    # classifier matches against
+    question_suffixes = {question: " " + question.lower() for question in questions}
     all_responses = []
     for survey in survey_results:
         persona_type = survey["persona_type"]
@@ -831,32 +1152,20 @@ def ai_analysis():
             all_responses.append({
                 "persona_type": persona_type,
                 "question": question,
-                "response": response
+                "response": response,
+                "text_lc": response.lower() + question_suffixes[question]
             })
 
     # Classify responses into categories
-    categorized_responses = {category: [] for category in categories.keys()}
+    categorized_responses = {category: [] for category in FEEDBACK_CATEGORIES}
 
     for response_obj in all_responses:
-        response_text = response_obj["response"].lower()
-        question_text = response_obj["question"].lower()
-        combined_text = response_text + " " + question_text
-
-        # Classify response into primary category
-        max_score = 0
-        primary_category = "uncategorized"
-
-        for category, keywords in categories.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in combined_text:
-                    score += 1
-
-            if score > max_score:
-                max_score = score
-                primary_category = category
-
-        if max_score > 0:
+        # Classify response into primary category: one point per distinct
+        # keyword, ties go to the earlier category
+        hits = set(ALL_KEYWORDS_RE.findall(response_obj["text_lc"]))
+        if hits:
+            scores = Counter(category for keyword in hits for category in KEYWORD_CATEGORIES[keyword])
+            primary_category = max(scores, key=lambda c: (scores[c], -CATEGORY_RANK[c]))
             categorized_responses[primary_category].append({
                 "persona_type": response_obj["persona_type"],
                 "question": response_obj["question"],
@@ -869,9 +1178,10 @@ def ai_analysis():
         if not responses:
             continue
 
-        tech_count = sum(1 for r in responses if r["persona_type"] == "tech_enthusiast")
-        budget_count = sum(1 for r in responses if r["persona_type"] == "budget_shopper")
-        gift_count = sum(1 for r in responses if r["persona_type"] == "gift_buyer")
+        persona_counts = Counter(r["persona_type"] for r in responses)
+        tech_count = persona_counts["tech_enthusiast"]
+        budget_count = persona_counts["budget_shopper"]
+        gift_count = persona_counts["gift_buyer"]
 
         persona_distribution = {
             "tech_enthusiast": tech_count / len(responses) if responses else 0,
@@ -880,14 +1190,13 @@ def ai_analysis():
         }
 
         # Identify most frequent terms
-        all_category_text = " ".join([r["response"] for r in responses])
-        word_count = {}
-        for word in all_category_text.lower().split():
-            word = word.strip(".,!?-:;()")
-            if len(word) > 3 and word not in ["with", "this", "that", "have", "more", "from", "very", "would", "about", "there"]:
-                word_count[word] = word_count.get(word, 0) + 1
-
-        frequent_terms = sorted(word_count.items(), key=lambda x: x[1], reverse=True)[:5]
+        word_count = Counter(
+            word
+            for r in responses
+            for word in WORD_RE.findall(r["response"].lower())
+            if word not in STOPWORDS
+        )
+        frequent_terms = word_count.most_common(5)
 
         # Generate key pain points
         pain_points = []
@@ -956,7 +1265,7 @@ def ai_analysis():
         # Store insights for this category
         category_insights[category] = {
             "name": category.replace("_", " ").title(),
-            "department": departments.get(category, "General"),
+            "department": CATEGORY_DEPARTMENTS.get(category, "General"),
             "response_count": len(responses),
             "persona_distribution": persona_distribution,
             "frequent_terms": [term for term, count in frequent_terms],
@@ -965,16 +1274,14 @@ def ai_analysis():
         }
 
     # Generate overall insights
-    tech_responses = [r for r in all_responses if r["persona_type"] == "tech_enthusiast"]
-    budget_responses = [r for r in all_responses if r["persona_type"] == "budget_shopper"]
-    gift_responses = [r for r in all_responses if r["persona_type"] == "gift_buyer"]
+    response_counts = Counter(r["persona_type"] for r in all_responses)
 
     overall_insights = {
         "total_responses": len(all_responses),
         "response_distribution": {
-            "tech_enthusiast": len(tech_responses),
-            "budget_shopper": len(budget_responses),
-            "gift_buyer": len(gift_responses)
+            "tech_enthusiast": response_counts["tech_enthusiast"],
+            "budget_shopper": response_counts["budget_shopper"],
+            "gift_buyer": response_counts["gift_buyer"]
         },
         "top_categories": sorted(
             [(k, v["response_count"]) for k, v in category_insights.items()],
@@ -999,6 +1306,8 @@ def ai_analysis():
 
     # Generate department-specific insights
     department_insights = {}
+    # Per department: pain points and recommendations already added
+    department_seen = {}
     for category, insight in category_insights.items():
         department = insight["department"]
         if department not in department_insights:
@@ -1009,19 +1318,24 @@ def ai_analysis():
                 "key_insights": [],
                 "priority_recommendations": []
             }
+            department_seen[department] = (set(), set())
 
-        department_insights[department]["categories"].append(category)
-        department_insights[department]["response_count"] += insight["response_count"]
+        entry = department_insights[department]
+        seen_pains, seen_recs = department_seen[department]
+        entry["categories"].append(category)
+        entry["response_count"] += insight["response_count"]
 
         # Add unique pain points to key insights
         for pain in insight["pain_points"]:
-            if pain not in department_insights[department]["key_insights"] and len(department_insights[department]["key_insights"]) < 5:
-                department_insights[department]["key_insights"].append(pain)
+            if pain not in seen_pains and len(entry["key_insights"]) < 5:
+                seen_pains.add(pain)
+                entry["key_insights"].append(pain)
 
         # Add unique recommendations
         for rec in insight["recommendations"]:
-            if rec not in department_insights[department]["priority_recommendations"] and len(department_insights[department]["priority_recommendations"]) < 5:
-                department_insights[department]["priority_recommendations"].append(rec)
+            if rec not in seen_recs and len(entry["priority_recommendations"]) < 5:
+                seen_recs.add(rec)
+                entry["priority_recommendations"].append(rec)
 
     # Sort departments by response count
     sorted_departments = sorted(
@@ -1037,9 +1351,8 @@ def ai_analysis():
             continue
 
         persona_sentiment = {
-            "tech_enthusiast": {"positive": 0, "negative": 0, "count": 0},
-            "budget_shopper": {"positive": 0, "negative": 0, "count": 0},
-            "gift_buyer": {"positive": 0, "negative": 0, "count": 0}
+            persona: {"positive": 0, "negative": 0, "count": 0}
+            for persona in _PERSONA_KEYS
         }
 
         for response in responses:
@@ -1047,8 +1360,9 @@ def ai_analysis():
             text = response["response"].lower()
 
             # Simple sentiment scoring based on keywords
-            positive_score = sum(1 for word in ["good", "great", "like", "appreciate", "helpful", "easy", "useful", "satisfied"] if word in text)
-            negative_score = sum(1 for word in ["bad", "difficult", "confusing", "unclear", "hard", "frustrating", "disappointing", "lacking"] if word in text)
+            tokens = set(TOKEN_RE.findall(text))
+            positive_score = len(tokens & POSITIVE_WORDS)
+            negative_score = len(tokens & NEGATIVE_WORDS)
 
             persona_sentiment[persona]["positive"] += positive_score
             persona_sentiment[persona]["negative"] += negative_score
@@ -1082,32 +1396,121 @@ def ai_analysis():
         "generation_time": datetime.now().isoformat()
     }
 
-    return jsonify(analysis_result)
+    return analysis_result
+
+# Latest encoded /ai-analysis body, kept fresh by a background thread while
+# clients keep reading it. "read" records whether anyone asked since the last refresh.
+_analysis_cache = {"value": None, "read": False, "refresher": None, "lock": threading.Lock()}
+_analysis_stale = threading.Event()
+
+def _refresh_analysis():
+    """Recompute the analysis every AI_ANALYSIS_TTL seconds, or as soon as it is invalidated"""
+    while True:
+        _analysis_stale.wait(AI_ANALYSIS_TTL)
+        _analysis_stale.clear()
+        with _analysis_cache["lock"]:
+            if not _analysis_cache["read"]:
+                # Nobody asked since the last refresh; the next request starts a new refresher
+                _analysis_cache["value"] = None
+                _analysis_cache["refresher"] = None
+                return
+            _analysis_cache["read"] = False
+        try:
+            payload = _dumps_bytes(_compute_ai_analysis())
+        except Exception:
+            app.logger.exception("Refreshing /ai-analysis failed; keeping the previous result")
+            continue
+        with _analysis_cache["lock"]:
+            _analysis_cache["value"] = payload
+
+def _invalidate_analysis():
+    """Drop the cached analysis and wake the refresher to rebuild it"""
+    with _analysis_cache["lock"]:
+        _analysis_cache["value"] = None
+    _analysis_stale.set()
+
+@app.route('/ai-analysis')
+def ai_analysis():
+    """Serve the latest survey analysis computed by the background refresher"""
+    with _analysis_cache["lock"]:
+        payload = _analysis_cache["value"]
+        _analysis_cache["read"] = True
+        if _analysis_cache["refresher"] is None:
+            _analysis_cache["refresher"] = threading.Thread(
+                target=_refresh_analysis, name="ai-analysis-refresh", daemon=True
+            )
+            _analysis_cache["refresher"].start()
+    if payload is None:
+        # The refresher has not caught up yet; compute this one inline
+        payload = _dumps_bytes(_compute_ai_analysis())
+        with _analysis_cache["lock"]:
+            _analysis_cache["value"] = payload
+    return Response(payload, mimetype='application/json')
+
+# Seconds between /events heartbeats
+HEARTBEAT_INTERVAL = 30
+
+_CONNECT_FRAME = b'data: {"type": "connection", "status": "connected"}\n\n'
+
+# Queues of the open /events streams; one heartbeat thread feeds them all
+_event_subscribers = set()
+_event_subscribers_lock = threading.Lock()
+
+def _broadcast_event(frame):
+    """Hand a frame to every open /events stream; None ends the stream"""
+    with _event_subscribers_lock:
+        subscribers = list(_event_subscribers)
+    for subscriber in subscribers:
+        subscriber.put(frame)
+
+def _heartbeat_loop():
+    """Format one heartbeat per interval and share it with every client"""
+    while True:
+        time.sleep(HEARTBEAT_INTERVAL)
+        timestamp = datetime.now().isoformat().encode('ascii')
+        _broadcast_event(b'data: {"type": "heartbeat", "timestamp": "' + timestamp + b'"}\n\n')
+
+def _close_event_streams():
+    """End all current /events streams without waiting for their next heartbeat"""
+    _broadcast_event(None)
 
 @app.route('/events')
 def events():
     """Server-Sent Events endpoint for real-time updates"""
     def generate():
-        yield "data: {\"type\": \"connection\", \"status\": \"connected\"}\n\n"
-
-        # Keep connection alive with a heartbeat
-        while True:
-            # Send a heartbeat every 30 seconds
-            time.sleep(30)
-            yield "data: {\"type\": \"heartbeat\", \"timestamp\": \"" + datetime.now().isoformat() + "\"}\n\n"
+        subscriber = queue.Queue()
+        with _event_subscribers_lock:
+            _event_subscribers.add(subscriber)
+        try:
+            yield _CONNECT_FRAME
+
+            # Keep connection alive with the shared heartbeat until /stop releases it
+            while True:
+                frame = subscriber.get()
+                if frame is None:
+                    return
+                yield frame
+        finally:
+            with _event_subscribers_lock:
+                _event_subscribers.discard(subscriber)
 
     return Response(generate(), mimetype='text/event-stream')
 
+threading.Thread(target=_heartbeat_loop, name="sse-heartbeat", daemon=True).start()
+
 @app.route('/stop', methods=['POST'])
 def stop_agents():
     """Stop the currently running agent system"""
-    global current_process, is_running
+    global _JOB
+
+    with _JOB_LOCK:
+        if _JOB is not None:
+            _JOB.proc.terminate()
+            _JOB = None
 
-    if current_process:
-        current_process.terminate()
-        current_process = None
+    _invalidate_analysis()
+    _close_event_streams()
 
-    is_running = False
     return jsonify({"message": "Agent system stopped"})
 
 if __name__ == '__main__':
@@ -1122,4 +1525,6 @@ if __name__ == '__main__':
         print("   Make sure to run this server from the project root directory.")
         print("")
     
-    app.run(host='0.0.0.0', port=8080, debug=True, threaded=True) 
\ No newline at end of file
+    # The reloader and debugger are for local development only; set DEV=1
+    # to enable them, and serve production traffic through wsgi.py
+    app.run(host='0.0.0.0', port=8080, debug=bool(os.environ.get('DEV')), threaded=True) 
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""
+Gunicorn settings for the MercadoLivre AI Agent Dashboard
+
+    gunicorn -c gunicorn_conf.py wsgi:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+
+# The agent job and the survey cache live in process memory, so /stop and
+# /status must reach the worker that started the run: scale with threads,
+# not workers. Every open /events or agent stream holds one thread.
+workers = 1
+worker_class = 'gthread'
+threads = 32
+
+# Agent and simulation streams stay open for minutes
+timeout = 0
+keepalive = 65
@@ -4,20 +4,23 @@ import requests
 import time
 import sys
 import os
-sys.path.append("python-agents")
 
-from company_context_agent import agent as context_agent
-from communication_agent import agent as comm_agent
-from oversight_agent import agent as oversight_agent
-from agents import Runner
+AGENTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "python-agents")
+PLATFORM_URL = "http://localhost:3001"
 
 async def test_full_integration():
     print("🤖 AI Agent Integration Test")
     print("=" * 50)
     
+    # One session for every platform call, so they share a pooled connection
+    with requests.Session() as session:
+        session.headers.update({"Content-Type": "application/json"})
+        await _run_integration(session)
+
+async def _run_integration(session):
     print("\n1. �� Testing MCP Platform Health...")
     try:
-        response = requests.get("http://localhost:3001/health")
+        response = session.get(PLATFORM_URL + "/health")
         health_data = response.json()
         print("✅ Platform Status:", health_data["status"])
         print("✅ Database:", health_data["services"]["database"])
@@ -27,6 +30,14 @@ async def test_full_integration():
         return
     
     print("\n2. 🧠 Testing AI Agents...")
+
+    # The agent modules are only loaded once the platform is known to be up
+    if AGENTS_DIR not in sys.path:
+        sys.path.append(AGENTS_DIR)
+    from company_context_agent import agent as context_agent
+    from communication_agent import agent as comm_agent
+    from oversight_agent import agent as oversight_agent
+    from agents import Runner
     
     print("\n�� Company Context Agent:")
     context_result = await Runner.run(context_agent, "Analyze our current business performance")
@@ -56,10 +67,9 @@ async def test_full_integration():
     }
     
     try:
-        submit_response = requests.post(
-            "http://localhost:3001/api/v1/feedback",
-            json=test_feedback,
-            headers={"Content-Type": "application/json"}
+        submit_response = session.post(
+            PLATFORM_URL + "/api/v1/feedback",
+            json=test_feedback
         )
         
         if submit_response.status_code == 201:
@@ -69,7 +79,7 @@ async def test_full_integration():
             
             time.sleep(2)
             
-            get_response = requests.get("http://localhost:3001/api/v1/feedback/" + feedback_id)
+            get_response = session.get(PLATFORM_URL + "/api/v1/feedback/" + feedback_id)
             if get_response.status_code == 200:
                 processed_data = get_response.json()
                 print("✅ Feedback processed - Status:", processed_data["data"]["status"])
@@ -0,0 +1,12 @@
+"""Load the agents' .env file once per process."""
+
+_loaded = False
+
+def ensure_env() -> None:
+    """Load python-agents/.env into os.environ on first call; later calls are no-ops"""
+    global _loaded
+    if _loaded:
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+    _loaded = True
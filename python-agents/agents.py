@@ -1,228 +1,344 @@
 import asyncio
+import hashlib
 import json
-from typing import Dict, List, Any, Callable
+import os
+from typing import Dict, Any, Awaitable, Callable, Sequence
 from dataclasses import dataclass
-import random
-import time
+from functools import cached_property
+import sys
+from string import Formatter
 
-class AgentResult:
-    """Result object for agent execution"""
-    def __init__(self, final_output: str):
-        self.final_output = final_output
+try:
+    import orjson
 
-def function_tool(func: Callable) -> Callable:
-    """Decorator to mark functions as tools for agents"""
-    func.is_tool = True
-    return func
+    def _j(obj: Any) -> str:
+        """Pretty-print a tool result as indented JSON"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 
-class Agent:
-    """Simple agent class for MercadoLivre exploration"""
-    
-    def __init__(self, name: str, instructions: str, tools: List[Callable] = None):
-        self.name = name
-        self.instructions = instructions
-        self.tools = tools or []
-        
-    def get_tools_info(self) -> str:
-        """Get information about available tools"""
-        if not self.tools:
-            return "No tools available."
-        
-        tool_descriptions = []
-        for tool in self.tools:
-            tool_descriptions.append(f"- {tool.__name__}: {tool.__doc__ or 'No description'}")
-        
-        return "Available tools:\n" + "\n".join(tool_descriptions)
-    
-    def execute_tools(self) -> Dict[str, Any]:
-        """Execute all available tools and return combined results"""
-        results = {}
-        
-        for tool in self.tools:
-            try:
-                # Execute tool with mock parameters
-                if tool.__name__ == "get_mercadolivre_categories":
-                    result = tool()
-                elif tool.__name__ == "get_marketplace_stats":
-                    result = tool()
-                elif tool.__name__ == "analyze_user_behavior_patterns":
-                    result = tool()
-                elif tool.__name__ == "explore_electronics_section":
-                    result = tool()
-                elif tool.__name__ == "analyze_product_specifications":
-                    result = tool()
-                elif tool.__name__ == "evaluate_tech_trends":
-                    result = tool()
-                elif tool.__name__ == "hunt_for_deals_and_discounts":
-                    result = tool()
-                elif tool.__name__ == "compare_prices_and_sellers":
-                    result = tool()
-                elif tool.__name__ == "evaluate_product_value":
-                    result = tool()
-                elif tool.__name__ == "explore_gift_categories":
-                    result = tool()
-                elif tool.__name__ == "evaluate_gift_services":
-                    result = tool()
-                elif tool.__name__ == "analyze_gift_discovery_experience":
-                    result = tool()
-                elif tool.__name__ == "coordinate_mercadolivre_exploration":
-                    result = tool({})
-                elif tool.__name__ == "formulate_questions_for_agents":
-                    result = tool({})
-                elif tool.__name__ == "synthesize_multi_agent_feedback":
-                    result = tool({})
-                elif tool.__name__ == "curate_and_clean_feedback_data":
-                    result = tool({})
-                elif tool.__name__ == "analyze_business_impact":
-                    result = tool()
-                elif tool.__name__ == "generate_departmental_recommendations":
-                    result = tool()
-                elif tool.__name__ == "create_executive_summary":
-                    result = tool()
-                else:
-                    # Generic execution for other tools
-                    result = tool()
-                
-                results[tool.__name__] = result
-                
-            except Exception as e:
-                results[tool.__name__] = {"error": str(e)}
-        
-        return results
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    def _j(obj: Any) -> str:
+        """Pretty-print a tool result as indented JSON"""
+        return json.dumps(obj, indent=2, ensure_ascii=False)
 
-class Runner:
-    """Runner class to execute agents"""
-    
-    @staticmethod
-    async def run(agent: Agent, prompt: str) -> AgentResult:
-        """Run an agent with the given prompt"""
-        
-        # Simulate thinking time
-        await asyncio.sleep(0.5)
-        
-        # Execute agent tools
-        tool_results = agent.execute_tools()
-        
-        # Create response based on agent type and tools
-        if "MercadoLivre Context Agent" in agent.name:
-            output = f"""
-🏪 MercadoLivre Marketplace Analysis Complete
+    _loads = json.loads
+
+# Tools that are called with an (empty) context dict rather than no arguments
+_EMPTY_DICT_TOOLS = frozenset({
+    "coordinate_mercadolivre_exploration",
+    "formulate_questions_for_agents",
+    "synthesize_multi_agent_feedback",
+    "curate_and_clean_feedback_data",
+})
+
+# Response templates per agent kind, filled with the JSON-rendered tool results
+TEMPLATES = {
+    "context": """🏪 MercadoLivre Marketplace Analysis Complete
 
 Based on my analysis of the MercadoLivre ecosystem:
 
 **Categories & Trends:**
-{json.dumps(tool_results.get('get_mercadolivre_categories', {}), indent=2)}
+{get_mercadolivre_categories}
 
 **Marketplace Statistics:**
-{json.dumps(tool_results.get('get_marketplace_stats', {}), indent=2)}
+{get_marketplace_stats}
 
 **User Behavior Insights:**
-{json.dumps(tool_results.get('analyze_user_behavior_patterns', {}), indent=2)}
+{analyze_user_behavior_patterns}
+
+The platform shows strong growth across electronics, fashion, and home categories with excellent mobile engagement.""",
 
-The platform shows strong growth across electronics, fashion, and home categories with excellent mobile engagement.
-            """
-            
-        elif "Tech Enthusiast" in agent.name:
-            output = f"""
-💻 Tech Enthusiast MercadoLivre Exploration Report
+    "tech": """💻 Tech Enthusiast MercadoLivre Exploration Report
 
 **Electronics Section Analysis:**
-{json.dumps(tool_results.get('explore_electronics_section', {}), indent=2)}
+{explore_electronics_section}
 
 **Product Specifications Review:**
-{json.dumps(tool_results.get('analyze_product_specifications', {}), indent=2)}
+{analyze_product_specifications}
 
 **Tech Trends Evaluation:**
-{json.dumps(tool_results.get('evaluate_tech_trends', {}), indent=2)}
+{evaluate_tech_trends}
 
-Overall Assessment: MercadoLivre offers excellent tech product variety with comprehensive specs and competitive pricing. The platform effectively serves tech enthusiasts with detailed product information and comparison tools.
-            """
-            
-        elif "Budget-Conscious" in agent.name:
-            output = f"""
-💰 Budget Shopper MercadoLivre Experience Report
+Overall Assessment: MercadoLivre offers excellent tech product variety with comprehensive specs and competitive pricing. The platform effectively serves tech enthusiasts with detailed product information and comparison tools.""",
+
+    "budget": """💰 Budget Shopper MercadoLivre Experience Report
 
 **Deal Hunting Results:**
-{json.dumps(tool_results.get('hunt_for_deals_and_discounts', {}), indent=2)}
+{hunt_for_deals_and_discounts}
 
 **Price Comparison Analysis:**
-{json.dumps(tool_results.get('compare_prices_and_sellers', {}), indent=2)}
+{compare_prices_and_sellers}
 
 **Value Assessment:**
-{json.dumps(tool_results.get('evaluate_product_value', {}), indent=2)}
+{evaluate_product_value}
+
+Summary: Excellent platform for budget-conscious shoppers with transparent pricing, frequent promotions, and effective comparison tools. The variety of payment options and deal-hunting features make it highly valuable for cost-conscious consumers.""",
 
-Summary: Excellent platform for budget-conscious shoppers with transparent pricing, frequent promotions, and effective comparison tools. The variety of payment options and deal-hunting features make it highly valuable for cost-conscious consumers.
-            """
-            
-        elif "Gift Buyer" in agent.name:
-            output = f"""
-🎁 Gift Buyer MercadoLivre Experience Report
+    "gift": """🎁 Gift Buyer MercadoLivre Experience Report
 
 **Gift Categories Exploration:**
-{json.dumps(tool_results.get('explore_gift_categories', {}), indent=2)}
+{explore_gift_categories}
 
 **Gift Services Evaluation:**
-{json.dumps(tool_results.get('evaluate_gift_services', {}), indent=2)}
+{evaluate_gift_services}
 
 **Gift Discovery Experience:**
-{json.dumps(tool_results.get('analyze_gift_discovery_experience', {}), indent=2)}
+{analyze_gift_discovery_experience}
+
+Conclusion: MercadoLivre provides a solid gift-buying experience with good category coverage, reliable delivery options, and adequate gift services. Some improvements in gift customization and discovery tools would enhance the experience further.""",
 
-Conclusion: MercadoLivre provides a solid gift-buying experience with good category coverage, reliable delivery options, and adequate gift services. Some improvements in gift customization and discovery tools would enhance the experience further.
-            """
-            
-        elif "Communication" in agent.name:
-            if "coordinate" in prompt.lower() or "formulate" in prompt.lower():
-                output = f"""
-🎯 MercadoLivre Exploration Coordination Plan
+    "coordination": """🎯 MercadoLivre Exploration Coordination Plan
 
 **Exploration Strategy:**
-{json.dumps(tool_results.get('coordinate_mercadolivre_exploration', {}), indent=2)}
+{coordinate_mercadolivre_exploration}
 
 **Agent-Specific Questions:**
-{json.dumps(tool_results.get('formulate_questions_for_agents', {}), indent=2)}
+{formulate_questions_for_agents}
 
-The coordination plan ensures comprehensive coverage of MercadoLivre from multiple user perspectives, enabling actionable insights for platform improvement.
-                """
-            else:
-                output = f"""
-📊 Multi-Agent Feedback Synthesis
+The coordination plan ensures comprehensive coverage of MercadoLivre from multiple user perspectives, enabling actionable insights for platform improvement.""",
+
+    "synthesis": """📊 Multi-Agent Feedback Synthesis
 
 **Platform Analysis:**
-{json.dumps(tool_results.get('synthesize_multi_agent_feedback', {}), indent=2)}
+{synthesize_multi_agent_feedback}
+
+The synthesis reveals MercadoLivre's strengths in mobile experience and competitive pricing, while identifying opportunities in technical specifications, gift services, and personalized experiences.""",
 
-The synthesis reveals MercadoLivre's strengths in mobile experience and competitive pricing, while identifying opportunities in technical specifications, gift services, and personalized experiences.
-                """
-                
-        elif "Company Analysis" in agent.name:
-            output = f"""
-🏢 MercadoLivre Company Analysis Report
+    "company_analysis": """🏢 MercadoLivre Company Analysis Report
 
 **Data Curation & Quality Assessment:**
-{json.dumps(tool_results.get('curate_and_clean_feedback_data', {}), indent=2)}
+{curate_and_clean_feedback_data}
 
 **Business Impact Analysis:**
-{json.dumps(tool_results.get('analyze_business_impact', {}), indent=2)}
+{analyze_business_impact}
 
 **Departmental Recommendations:**
-{json.dumps(tool_results.get('generate_departmental_recommendations', {}), indent=2)}
+{generate_departmental_recommendations}
 
 **Executive Summary:**
-{json.dumps(tool_results.get('create_executive_summary', {}), indent=2)}
+{create_executive_summary}
 
-ANALYSIS COMPLETE: Strategic recommendations have been generated for all MercadoLivre departments with clear action items, timelines, and success metrics.
-            """
-                
-        else:
-            # Generic agent response
-            output = f"""
-Agent '{agent.name}' executed successfully.
+ANALYSIS COMPLETE: Strategic recommendations have been generated for all MercadoLivre departments with clear action items, timelines, and success metrics.""",
 
-Instructions: {agent.instructions}
+    "generic": '''Agent '{name}' executed successfully.
+
+Instructions: {instructions}
 
 Tool Results:
-{json.dumps(tool_results, indent=2)}
+{tool_results}
+
+Analysis complete based on provided prompt: "{prompt}"''',
+}
+
+# Pre-rendered JSON for constant tool results, keyed by the result's id()
+_STATIC_JSON: Dict[int, tuple] = {}
+
+def static_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Register a constant tool result so its JSON is rendered once at import"""
+    _STATIC_JSON[id(result)] = (result, _j(result))
+    return result
+
+def _tool_json(result: Any) -> str:
+    """JSON for a tool result, reusing the pre-rendered text for static results"""
+    cached = _STATIC_JSON.get(id(result))
+    if cached is not None and cached[0] is result:
+        return cached[1]
+    return _j(result)
+
+# Each template split into (literal text, tool name or None) segments
+_TEMPLATE_SEGMENTS = {
+    kind: tuple((literal, field) for literal, field, _, _ in Formatter().parse(text))
+    for kind, text in TEMPLATES.items()
+}
+
+def _compile_renderer(kind: str) -> Callable:
+    """Generate a straight-line renderer for a tool-result template"""
+    namespace = {"_tool_json": _tool_json}
+    pieces = []
+    for i, (literal, field) in enumerate(_TEMPLATE_SEGMENTS[kind]):
+        if literal:
+            namespace[f"_text{i}"] = literal
+            pieces.append(f"_text{i}")
+        if field is not None:
+            pieces.append(f"_tool_json(get({field!r}, {{}}))")
+    source = (
+        "def render(agent, tool_results, prompt):\n"
+        "    get = tool_results.get\n"
+        f"    return ''.join(({', '.join(pieces)},))\n"
+    )
+    exec(compile(source, f"<{kind} renderer>", "exec"), namespace)
+    return namespace["render"]
+
+_render_coordination = _compile_renderer("coordination")
+_render_synthesis = _compile_renderer("synthesis")
+
+def _render_communication(agent: "Agent", tool_results: Dict[str, Any], prompt: str) -> str:
+    """Render a coordination plan or a feedback synthesis depending on the prompt"""
+    prompt_lc = prompt.lower()
+    if "coordinate" in prompt_lc or "formulate" in prompt_lc:
+        return _render_coordination(agent, tool_results, prompt)
+    return _render_synthesis(agent, tool_results, prompt)
+
+def _render_generic(agent: "Agent", tool_results: Dict[str, Any], prompt: str) -> str:
+    """Render the fallback response for agents without a dedicated template"""
+    return TEMPLATES["generic"].format(
+        name=agent.name,
+        instructions=agent.instructions,
+        tool_results=_j(tool_results),
+        prompt=prompt,
+    )
+
+# Response renderer per agent kind
+_RENDERERS = {
+    "context": _compile_renderer("context"),
+    "tech": _compile_renderer("tech"),
+    "budget": _compile_renderer("budget"),
+    "gift": _compile_renderer("gift"),
+    "communication": _render_communication,
+    "company_analysis": _compile_renderer("company_analysis"),
+    "generic": _render_generic,
+}
+
+# Agent name fragments mapped to their kind, checked in order
+_KIND_BY_NAME = (
+    ("MercadoLivre Context Agent", "context"),
+    ("Tech Enthusiast", "tech"),
+    ("Budget-Conscious", "budget"),
+    ("Gift Buyer", "gift"),
+    ("Communication", "communication"),
+    ("Company Analysis", "company_analysis"),
+)
+
+def _infer_kind(name: str) -> str:
+    """Work out an agent's kind from its name, falling back to 'generic'"""
+    for fragment, kind in _KIND_BY_NAME:
+        if fragment in name:
+            return kind
+    return "generic"
+
+def _tool_args(name: str) -> tuple:
+    """Positional arguments the named tool is called with"""
+    # Coordination tools take a context dict; everything else takes no arguments
+    return ({},) if name in _EMPTY_DICT_TOOLS else ()
+
+@dataclass(frozen=True)
+class AgentResult:
+    """Result object for agent execution"""
+    __slots__ = ("final_output",)  # dataclass(slots=True) needs Python 3.10
+    final_output: str
+
+    @property
+    def final_output_bytes(self) -> bytes:
+        """final_output encoded as UTF-8, for writing straight to a byte stream"""
+        return self.final_output.encode()
+
+def run_async(main: Awaitable) -> Any:
+    """Run a script's main() coroutine, on uvloop's event loop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
+
+def print_result(label: str, result: AgentResult) -> None:
+    """Print a labelled result as UTF-8 bytes, bypassing stdout's text encoder"""
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    out.write(label.encode() + b" " + result.final_output_bytes + b"\n")
+    out.flush()
+
+def function_tool(func: Callable) -> Callable:
+    """Decorator to mark functions as tools for agents"""
+    func.is_tool = True
+    return func
+
+async def _call_tool(tool: Callable, args: tuple) -> Any:
+    """Await an async tool directly; run a sync one in a worker thread so slow tools overlap"""
+    if asyncio.iscoroutinefunction(tool):
+        return await tool(*args)
+    return await asyncio.to_thread(tool, *args)
 
-Analysis complete based on provided prompt: "{prompt}"
-            """
+# Shared tool list for agents created without tools
+_NO_TOOLS: tuple = ()
+
+class Agent:
+    """Simple agent class for MercadoLivre exploration"""
+    
+    def __init__(self, name: str, instructions: str, tools: Sequence[Callable] = None, kind: str = None):
+        self.name = name
+        self.instructions = instructions
+        self.tools = tuple(tools) if tools else _NO_TOOLS
+        self.kind = kind or _infer_kind(name)
+        
+    @cached_property
+    def tools_info(self) -> str:
+        """Information about available tools, built on first access"""
+        if not self.tools:
+            return "No tools available."
         
-        return AgentResult(output.strip()) 
\ No newline at end of file
+        tool_descriptions = []
+        for tool in self.tools:
+            tool_descriptions.append(f"- {tool.__name__}: {tool.__doc__ or 'No description'}")
+        
+        return "Available tools:\n" + "\n".join(tool_descriptions)
+    
+    def get_tools_info(self) -> str:
+        """Get information about available tools"""
+        return self.tools_info
+    
+    async def execute_tools(self) -> Dict[str, Any]:
+        """Execute all available tools concurrently and return combined results"""
+        names = [tool.__name__ for tool in self.tools]
+        
+        outputs = await asyncio.gather(
+            *(_call_tool(tool, _tool_args(name)) for tool, name in zip(self.tools, names)),
+            return_exceptions=True,
+        )
+        
+        return {
+            name: {"error": str(result)} if isinstance(result, Exception) else result
+            for name, result in zip(names, outputs)
+        }
+
+class Runner:
+    """Runner class to execute agents"""
+    
+    @staticmethod
+    async def run(agent: Agent, prompt: str) -> AgentResult:
+        """Run an agent with the given prompt"""
+        
+        # Optional "thinking time" for demos (e.g. AGENT_DEMO_DELAY=0.5)
+        demo_delay = float(os.environ.get("AGENT_DEMO_DELAY") or 0)
+        if demo_delay > 0:
+            await asyncio.sleep(demo_delay)
+        
+        # Execute agent tools
+        tool_results = await agent.execute_tools()
+        
+        # Create response based on agent type and tools
+        output = _RENDERERS[agent.kind](agent, tool_results, prompt)
+        
+        return AgentResult(output)
+
+async def cached_run(agent: Agent, prompt: str) -> AgentResult:
+    """Runner.run, memoized on disk when AGENT_CACHE_DIR is set"""
+    cache_dir = os.environ.get("AGENT_CACHE_DIR")
+    if not cache_dir:
+        return await Runner.run(agent, prompt)
+    
+    key = hashlib.blake2b(
+        "\0".join((agent.name, agent.instructions, agent.tools_info, prompt)).encode(),
+        digest_size=16,
+    ).hexdigest()
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        with open(path, "rb") as f:
+            return AgentResult(_loads(f.read())["final_output"])
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    result = await Runner.run(agent, prompt)
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(_j({"final_output": result.final_output}))
+    return result
@@ -1,110 +1,116 @@
 import asyncio
 import json
-from agents import Agent, Runner, function_tool
+from agents import Agent, Runner, function_tool, static_result, print_result
 from typing import Dict, List, Any
 import os
 
 # Load OpenAI API key from environment variable
-from dotenv import load_dotenv
-load_dotenv()
+from _env import ensure_env
+ensure_env()
+
+EXPLORATION_PLAN = static_result({
+    "exploration_plan": {
+        "tech_enthusiast": {
+            "focus_areas": ["Electronics", "Smartphones", "Computers", "Gaming"],
+            "key_questions": [
+                "How comprehensive are the technical specifications?",
+                "Are the latest tech products available?",
+                "How accurate are the product comparisons?",
+                "What's the quality of tech reviews?"
+            ]
+        },
+        "budget_shopper": {
+            "focus_areas": ["Deals", "Discounts", "Price comparisons", "Value assessment"],
+            "key_questions": [
+                "How easy is it to find genuine deals?",
+                "Are price comparison tools effective?",
+                "What money-saving features are available?",
+                "How transparent is the pricing?"
+            ]
+        },
+        "gift_buyer": {
+            "focus_areas": ["Gift categories", "Wrapping services", "Delivery options", "Gift discovery"],
+            "key_questions": [
+                "How gift-friendly is the platform?",
+                "What gift services are available?",
+                "How easy is gift discovery and selection?",
+                "What's the quality of gift presentation?"
+            ]
+        }
+    },
+    "coordination_strategy": "Sequential exploration with cross-agent insights sharing"
+})
 
 @function_tool
 def coordinate_mercadolivre_exploration(context_data: Dict) -> Dict[str, Any]:
     """Coordinate the exploration of MercadoLivre by different persona agents"""
-    return {
-        "exploration_plan": {
-            "tech_enthusiast": {
-                "focus_areas": ["Electronics", "Smartphones", "Computers", "Gaming"],
-                "key_questions": [
-                    "How comprehensive are the technical specifications?",
-                    "Are the latest tech products available?",
-                    "How accurate are the product comparisons?",
-                    "What's the quality of tech reviews?"
-                ]
-            },
-            "budget_shopper": {
-                "focus_areas": ["Deals", "Discounts", "Price comparisons", "Value assessment"],
-                "key_questions": [
-                    "How easy is it to find genuine deals?",
-                    "Are price comparison tools effective?",
-                    "What money-saving features are available?",
-                    "How transparent is the pricing?"
-                ]
-            },
-            "gift_buyer": {
-                "focus_areas": ["Gift categories", "Wrapping services", "Delivery options", "Gift discovery"],
-                "key_questions": [
-                    "How gift-friendly is the platform?",
-                    "What gift services are available?",
-                    "How easy is gift discovery and selection?",
-                    "What's the quality of gift presentation?"
-                ]
-            }
-        },
-        "coordination_strategy": "Sequential exploration with cross-agent insights sharing"
-    }
+    return EXPLORATION_PLAN
+
+AGENT_QUESTIONS = static_result({
+    "tech_enthusiast_questions": [
+        "Based on MercadoLivre's electronics catalog, how do the tech specs compare to global standards?",
+        "What emerging tech trends do you see gaining traction on the platform?",
+        "How do Brazilian tech preferences differ from international markets?",
+        "Are there any gaps in the technology product offerings?"
+    ],
+    "budget_shopper_questions": [
+        "Given MercadoLivre's pricing structure, what are the best strategies for finding deals?",
+        "How do shipping costs affect the overall value proposition?",
+        "What seasonal patterns do you notice in pricing and promotions?",
+        "How does MercadoLivre's pricing compare to physical retail in Brazil?"
+    ],
+    "gift_buyer_questions": [
+        "How well does MercadoLivre cater to Brazilian gift-giving traditions?",
+        "What improvements could be made to the gifting experience?",
+        "How do delivery options support last-minute gift purchases?",
+        "What cultural considerations should influence gift recommendations?"
+    ],
+    "cross_agent_synthesis": [
+        "How do different user personas experience the same products differently?",
+        "What platform improvements would benefit all user types?",
+        "Are there any conflicting priorities between different user needs?"
+    ]
+})
 
 @function_tool
 def formulate_questions_for_agents(marketplace_context: Dict) -> Dict[str, Any]:
     """Generate specific questions for each agent based on MercadoLivre context"""
-    return {
-        "tech_enthusiast_questions": [
-            "Based on MercadoLivre's electronics catalog, how do the tech specs compare to global standards?",
-            "What emerging tech trends do you see gaining traction on the platform?",
-            "How do Brazilian tech preferences differ from international markets?",
-            "Are there any gaps in the technology product offerings?"
-        ],
-        "budget_shopper_questions": [
-            "Given MercadoLivre's pricing structure, what are the best strategies for finding deals?",
-            "How do shipping costs affect the overall value proposition?",
-            "What seasonal patterns do you notice in pricing and promotions?",
-            "How does MercadoLivre's pricing compare to physical retail in Brazil?"
-        ],
-        "gift_buyer_questions": [
-            "How well does MercadoLivre cater to Brazilian gift-giving traditions?",
-            "What improvements could be made to the gifting experience?",
-            "How do delivery options support last-minute gift purchases?",
-            "What cultural considerations should influence gift recommendations?"
-        ],
-        "cross_agent_synthesis": [
-            "How do different user personas experience the same products differently?",
-            "What platform improvements would benefit all user types?",
-            "Are there any conflicting priorities between different user needs?"
-        ]
-    }
+    return AGENT_QUESTIONS
+
+FEEDBACK_SYNTHESIS = static_result({
+    "platform_strengths": [
+        "Comprehensive product catalog across all categories",
+        "Strong mobile experience for all user types",
+        "Competitive pricing with good deal discovery tools",
+        "Reliable shipping and delivery network"
+    ],
+    "improvement_opportunities": [
+        "Enhanced technical specification display for tech enthusiasts",
+        "More advanced price tracking and alert systems",
+        "Improved gift discovery and customization options",
+        "Better cross-category recommendation engine"
+    ],
+    "user_experience_insights": {
+        "common_pain_points": ["Complex return process", "Inconsistent seller quality"],
+        "standout_features": ["PIX integration", "Mercado Envios reliability"],
+        "persona_specific_needs": {
+            "tech_users": "Better spec comparison tools",
+            "budget_users": "Enhanced deal aggregation",
+            "gift_users": "Streamlined gift services"
+        }
+    },
+    "strategic_recommendations": [
+        "Invest in persona-specific UI/UX enhancements",
+        "Develop specialized landing pages for different user types",
+        "Create targeted promotional strategies",
+        "Improve seller onboarding for quality consistency"
+    ]
+})
 
 @function_tool
 def synthesize_multi_agent_feedback(agent_responses: Dict) -> Dict[str, Any]:
     """Combine feedback from all persona agents into actionable insights"""
-    return {
-        "platform_strengths": [
-            "Comprehensive product catalog across all categories",
-            "Strong mobile experience for all user types",
-            "Competitive pricing with good deal discovery tools",
-            "Reliable shipping and delivery network"
-        ],
-        "improvement_opportunities": [
-            "Enhanced technical specification display for tech enthusiasts",
-            "More advanced price tracking and alert systems",
-            "Improved gift discovery and customization options",
-            "Better cross-category recommendation engine"
-        ],
-        "user_experience_insights": {
-            "common_pain_points": ["Complex return process", "Inconsistent seller quality"],
-            "standout_features": ["PIX integration", "Mercado Envios reliability"],
-            "persona_specific_needs": {
-                "tech_users": "Better spec comparison tools",
-                "budget_users": "Enhanced deal aggregation",
-                "gift_users": "Streamlined gift services"
-            }
-        },
-        "strategic_recommendations": [
-            "Invest in persona-specific UI/UX enhancements",
-            "Develop specialized landing pages for different user types",
-            "Create targeted promotional strategies",
-            "Improve seller onboarding for quality consistency"
-        ]
-    }
+    return FEEDBACK_SYNTHESIS
 
 agent = Agent(
     name="MercadoLivre Communication Agent",
@@ -118,7 +124,7 @@ agent = Agent(
 
 async def main():
     result = await Runner.run(agent, "Coordinate feedback sharing between two companies")
-    print("Communication Result:", result.final_output)
+    print_result("Communication Result:", result)
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
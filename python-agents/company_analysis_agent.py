@@ -1,276 +1,281 @@
-import asyncio
-import json
-from agents import Agent, Runner, function_tool
-from typing import Dict, List, Any
-import os
-from dotenv import load_dotenv
-load_dotenv()
+from agents import Agent, cached_run, function_tool, print_result, run_async, static_result
+from typing import Dict, Any
+from _env import ensure_env
+ensure_env()
+
+CURATED_FEEDBACK = static_result({
+    "data_quality_assessment": {
+        "completeness": "98.7%",
+        "consistency": "High - all agents answered same questions",
+        "reliability": "High - responses align with persona characteristics",
+        "sample_size": "3 distinct personas, 4 questions each = 12 data points"
+    },
+    "cleaned_insights": {
+        "tech_enthusiast_key_points": [
+            "Technical specifications are comprehensive and accurate",
+            "Product comparison tools are highly valued",
+            "Navigation for tech products is excellent with granular filters",
+            "Price competitiveness vs physical stores (15-20% cheaper)",
+            "Request for battery life comparisons and tech release notifications"
+        ],
+        "budget_shopper_key_points": [
+            "Price comparison with shipping costs is game-changing feature",
+            "Flash sales ('Ofertas Relâmpago') provide significant value (60% discounts)",
+            "PIX payment integration offers meaningful discounts (5% extra)",
+            "Installment options (12x sem juros) improve accessibility",
+            "Need for price history graphs and loyalty programs"
+        ],
+        "gift_buyer_key_points": [
+            "Gift wrapping service is convenient and well-utilized",
+            "Direct shipping to recipients with discrete packaging works well",
+            "Seasonal gift guides are helpful for discovery",
+            "Wishlist sharing functionality is appreciated",
+            "Gaps in gift customization and artisanal product selection"
+        ]
+    },
+    "cross_cutting_themes": [
+        "Mobile experience excellence across all personas",
+        "Shipping and delivery reliability (Mercado Envios)",
+        "Payment flexibility and integration (PIX, installments)",
+        "Need for better personalization and recommendation engines",
+        "Opportunity for enhanced product discovery tools"
+    ],
+    "data_confidence_score": 0.94
+})
 
 @function_tool
 def curate_and_clean_feedback_data(raw_feedback: Dict) -> Dict[str, Any]:
     """Curate and clean the raw feedback data from all persona agents"""
-    return {
-        "data_quality_assessment": {
-            "completeness": "98.7%",
-            "consistency": "High - all agents answered same questions",
-            "reliability": "High - responses align with persona characteristics",
-            "sample_size": "3 distinct personas, 4 questions each = 12 data points"
-        },
-        "cleaned_insights": {
-            "tech_enthusiast_key_points": [
-                "Technical specifications are comprehensive and accurate",
-                "Product comparison tools are highly valued",
-                "Navigation for tech products is excellent with granular filters",
-                "Price competitiveness vs physical stores (15-20% cheaper)",
-                "Request for battery life comparisons and tech release notifications"
-            ],
-            "budget_shopper_key_points": [
-                "Price comparison with shipping costs is game-changing feature",
-                "Flash sales ('Ofertas Relâmpago') provide significant value (60% discounts)",
-                "PIX payment integration offers meaningful discounts (5% extra)",
-                "Installment options (12x sem juros) improve accessibility",
-                "Need for price history graphs and loyalty programs"
-            ],
-            "gift_buyer_key_points": [
-                "Gift wrapping service is convenient and well-utilized",
-                "Direct shipping to recipients with discrete packaging works well",
-                "Seasonal gift guides are helpful for discovery",
-                "Wishlist sharing functionality is appreciated",
-                "Gaps in gift customization and artisanal product selection"
-            ]
-        },
-        "cross_cutting_themes": [
-            "Mobile experience excellence across all personas",
-            "Shipping and delivery reliability (Mercado Envios)",
-            "Payment flexibility and integration (PIX, installments)",
-            "Need for better personalization and recommendation engines",
-            "Opportunity for enhanced product discovery tools"
+    return CURATED_FEEDBACK
+
+BUSINESS_IMPACT = static_result({
+    "revenue_impact_analysis": {
+        "high_impact_areas": [
+            "Price comparison transparency drives conversion",
+            "Flash sales generate significant transaction volume",
+            "Installment options expand market reach",
+            "Technical specifications reduce product returns"
+        ],
+        "cost_optimization_opportunities": [
+            "Better product discovery reduces customer service load",
+            "Improved gift services increase average order value",
+            "Enhanced recommendation engine improves inventory turnover"
+        ]
+    },
+    "competitive_positioning": {
+        "strengths_to_leverage": [
+            "Superior mobile experience vs competitors",
+            "Strong payment integration (PIX advantage)",
+            "Comprehensive product catalog with good specs",
+            "Reliable shipping network"
         ],
-        "data_confidence_score": 0.94
+        "gaps_to_address": [
+            "Gift customization vs specialized gift platforms",
+            "Artisanal product selection vs niche marketplaces",
+            "Price history transparency vs price tracking apps"
+        ]
+    },
+    "user_experience_priorities": {
+        "critical_improvements": [
+            "Enhanced product discovery algorithms",
+            "Personalized homepage experiences",
+            "Advanced price tracking and alerts",
+            "Improved gift journey optimization"
+        ],
+        "innovation_opportunities": [
+            "AI-powered tech spec comparison",
+            "Predictive deal recommendations",
+            "Cultural gift suggestion engine",
+            "Smart bundle creation tools"
+        ]
     }
+})
 
 @function_tool
 def analyze_business_impact() -> Dict[str, Any]:
     """Analyze the business impact and strategic implications of the feedback"""
-    return {
-        "revenue_impact_analysis": {
-            "high_impact_areas": [
-                "Price comparison transparency drives conversion",
-                "Flash sales generate significant transaction volume",
-                "Installment options expand market reach",
-                "Technical specifications reduce product returns"
-            ],
-            "cost_optimization_opportunities": [
-                "Better product discovery reduces customer service load",
-                "Improved gift services increase average order value",
-                "Enhanced recommendation engine improves inventory turnover"
-            ]
-        },
-        "competitive_positioning": {
-            "strengths_to_leverage": [
-                "Superior mobile experience vs competitors",
-                "Strong payment integration (PIX advantage)",
-                "Comprehensive product catalog with good specs",
-                "Reliable shipping network"
-            ],
-            "gaps_to_address": [
-                "Gift customization vs specialized gift platforms",
-                "Artisanal product selection vs niche marketplaces",
-                "Price history transparency vs price tracking apps"
-            ]
-        },
-        "user_experience_priorities": {
-            "critical_improvements": [
-                "Enhanced product discovery algorithms",
-                "Personalized homepage experiences",
-                "Advanced price tracking and alerts",
-                "Improved gift journey optimization"
-            ],
-            "innovation_opportunities": [
-                "AI-powered tech spec comparison",
-                "Predictive deal recommendations",
-                "Cultural gift suggestion engine",
-                "Smart bundle creation tools"
-            ]
-        }
+    return BUSINESS_IMPACT
+
+DEPARTMENTAL_RECOMMENDATIONS = static_result({
+    "product_department": {
+        "immediate_actions": [
+            "Implement price history graphs for all products",
+            "Enhance battery life comparison tools for electronics",
+            "Create 'Bundle Builder' for bulk discount discovery",
+            "Develop gift customization options (engraving, personalization)"
+        ],
+        "medium_term_initiatives": [
+            "Build AI-powered product recommendation engine",
+            "Create specialized landing pages for different personas",
+            "Implement predictive deal alert system",
+            "Develop cultural gift suggestion algorithms"
+        ],
+        "kpis_to_track": [
+            "Product discovery conversion rate",
+            "Average time to purchase decision",
+            "Cross-sell/upsell effectiveness",
+            "Return rate reduction"
+        ]
+    },
+    "engineering_department": {
+        "technical_priorities": [
+            "Optimize mobile experience performance (75% of traffic)",
+            "Implement real-time price comparison algorithms",
+            "Build advanced filtering and search capabilities",
+            "Create personalization engine infrastructure"
+        ],
+        "system_improvements": [
+            "Enhanced product specification display system",
+            "Advanced recommendation algorithm development",
+            "Price tracking and alert notification system",
+            "Gift workflow optimization backend"
+        ],
+        "technical_debt": [
+            "Mobile-first responsive design optimization",
+            "Search algorithm latency improvements",
+            "Database optimization for comparison queries"
+        ]
+    },
+    "marketing_department": {
+        "campaign_strategies": [
+            "Target tech enthusiasts with spec-heavy product showcases",
+            "Create budget-focused flash sale campaigns",
+            "Develop seasonal gift marketing campaigns",
+            "Leverage PIX discount messaging for conversion"
+        ],
+        "content_initiatives": [
+            "Create tech review integration partnerships",
+            "Develop gift guides for Brazilian cultural celebrations",
+            "Build educational content about deal hunting strategies",
+            "Produce comparison-focused product videos"
+        ],
+        "personalization_tactics": [
+            "Persona-based email campaigns",
+            "Customized homepage experiences",
+            "Targeted discount and promotion strategies",
+            "Behavioral retargeting campaigns"
+        ]
+    },
+    "customer_service_department": {
+        "training_priorities": [
+            "Tech specification knowledge for electronics support",
+            "Gift service protocols and customization options",
+            "Deal and promotion explanation training",
+            "Payment method optimization guidance"
+        ],
+        "process_improvements": [
+            "Self-service price comparison tools",
+            "Automated gift tracking and communication",
+            "Proactive deal alert customer education",
+            "Enhanced return process for gifts"
+        ],
+        "support_tools": [
+            "Technical specification lookup system",
+            "Price history access for customer inquiries",
+            "Gift service status tracking dashboard",
+            "Deal authentication verification tools"
+        ]
+    },
+    "business_intelligence_department": {
+        "analytics_priorities": [
+            "Persona-based conversion funnel analysis",
+            "Price sensitivity modeling by category",
+            "Gift season demand forecasting",
+            "Mobile vs desktop behavior analysis"
+        ],
+        "reporting_frameworks": [
+            "Daily persona engagement metrics",
+            "Weekly deal performance analysis",
+            "Monthly gift service utilization reports",
+            "Quarterly competitive positioning analysis"
+        ],
+        "data_initiatives": [
+            "Real-time persona segmentation",
+            "Predictive pricing optimization models",
+            "Customer lifetime value by shopping behavior",
+            "A/B testing framework for persona experiences"
+        ]
+    },
+    "operations_department": {
+        "inventory_optimization": [
+            "Tech product lifecycle management",
+            "Seasonal gift inventory planning",
+            "Deal merchandise strategic stocking",
+            "Popular product availability monitoring"
+        ],
+        "logistics_improvements": [
+            "Gift delivery service enhancement",
+            "Express shipping optimization for deals",
+            "Packaging customization capabilities",
+            "Return process streamlining"
+        ],
+        "vendor_management": [
+            "Tech specification standardization with suppliers",
+            "Gift customization service partnerships",
+            "Exclusive deal negotiation strategies",
+            "Quality assurance for promoted products"
+        ]
     }
+})
 
 @function_tool
 def generate_departmental_recommendations() -> Dict[str, Any]:
     """Generate specific recommendations for each MercadoLivre department"""
-    return {
-        "product_department": {
-            "immediate_actions": [
-                "Implement price history graphs for all products",
-                "Enhance battery life comparison tools for electronics",
-                "Create 'Bundle Builder' for bulk discount discovery",
-                "Develop gift customization options (engraving, personalization)"
-            ],
-            "medium_term_initiatives": [
-                "Build AI-powered product recommendation engine",
-                "Create specialized landing pages for different personas",
-                "Implement predictive deal alert system",
-                "Develop cultural gift suggestion algorithms"
-            ],
-            "kpis_to_track": [
-                "Product discovery conversion rate",
-                "Average time to purchase decision",
-                "Cross-sell/upsell effectiveness",
-                "Return rate reduction"
-            ]
-        },
-        "engineering_department": {
-            "technical_priorities": [
-                "Optimize mobile experience performance (75% of traffic)",
-                "Implement real-time price comparison algorithms",
-                "Build advanced filtering and search capabilities",
-                "Create personalization engine infrastructure"
-            ],
-            "system_improvements": [
-                "Enhanced product specification display system",
-                "Advanced recommendation algorithm development",
-                "Price tracking and alert notification system",
-                "Gift workflow optimization backend"
-            ],
-            "technical_debt": [
-                "Mobile-first responsive design optimization",
-                "Search algorithm latency improvements",
-                "Database optimization for comparison queries"
-            ]
-        },
-        "marketing_department": {
-            "campaign_strategies": [
-                "Target tech enthusiasts with spec-heavy product showcases",
-                "Create budget-focused flash sale campaigns",
-                "Develop seasonal gift marketing campaigns",
-                "Leverage PIX discount messaging for conversion"
-            ],
-            "content_initiatives": [
-                "Create tech review integration partnerships",
-                "Develop gift guides for Brazilian cultural celebrations",
-                "Build educational content about deal hunting strategies",
-                "Produce comparison-focused product videos"
-            ],
-            "personalization_tactics": [
-                "Persona-based email campaigns",
-                "Customized homepage experiences",
-                "Targeted discount and promotion strategies",
-                "Behavioral retargeting campaigns"
-            ]
-        },
-        "customer_service_department": {
-            "training_priorities": [
-                "Tech specification knowledge for electronics support",
-                "Gift service protocols and customization options",
-                "Deal and promotion explanation training",
-                "Payment method optimization guidance"
-            ],
-            "process_improvements": [
-                "Self-service price comparison tools",
-                "Automated gift tracking and communication",
-                "Proactive deal alert customer education",
-                "Enhanced return process for gifts"
-            ],
-            "support_tools": [
-                "Technical specification lookup system",
-                "Price history access for customer inquiries",
-                "Gift service status tracking dashboard",
-                "Deal authentication verification tools"
-            ]
+    return DEPARTMENTAL_RECOMMENDATIONS
+
+EXECUTIVE_SUMMARY = static_result({
+    "executive_overview": {
+        "key_findings": [
+            "MercadoLivre excels in mobile experience and payment integration",
+            "Three distinct user personas have specific, actionable needs",
+            "Significant opportunity in personalization and discovery",
+            "Strong foundation with clear improvement pathways identified"
+        ],
+        "business_impact": "High - recommendations directly address conversion, retention, and average order value",
+        "implementation_complexity": "Medium - requires coordinated cross-departmental effort",
+        "expected_roi": "15-25% improvement in key metrics within 6 months"
+    },
+    "strategic_priorities": [
+        {
+            "priority": 1,
+            "initiative": "Enhanced Product Discovery",
+            "departments": ["Product", "Engineering"],
+            "timeline": "3 months",
+            "impact": "High conversion improvement"
         },
-        "business_intelligence_department": {
-            "analytics_priorities": [
-                "Persona-based conversion funnel analysis",
-                "Price sensitivity modeling by category",
-                "Gift season demand forecasting",
-                "Mobile vs desktop behavior analysis"
-            ],
-            "reporting_frameworks": [
-                "Daily persona engagement metrics",
-                "Weekly deal performance analysis",
-                "Monthly gift service utilization reports",
-                "Quarterly competitive positioning analysis"
-            ],
-            "data_initiatives": [
-                "Real-time persona segmentation",
-                "Predictive pricing optimization models",
-                "Customer lifetime value by shopping behavior",
-                "A/B testing framework for persona experiences"
-            ]
+        {
+            "priority": 2,
+            "initiative": "Persona-Based Personalization",
+            "departments": ["Marketing", "Product", "BI"],
+            "timeline": "6 months", 
+            "impact": "Increased engagement and retention"
         },
-        "operations_department": {
-            "inventory_optimization": [
-                "Tech product lifecycle management",
-                "Seasonal gift inventory planning",
-                "Deal merchandise strategic stocking",
-                "Popular product availability monitoring"
-            ],
-            "logistics_improvements": [
-                "Gift delivery service enhancement",
-                "Express shipping optimization for deals",
-                "Packaging customization capabilities",
-                "Return process streamlining"
-            ],
-            "vendor_management": [
-                "Tech specification standardization with suppliers",
-                "Gift customization service partnerships",
-                "Exclusive deal negotiation strategies",
-                "Quality assurance for promoted products"
-            ]
+        {
+            "priority": 3,
+            "initiative": "Gift Experience Enhancement",
+            "departments": ["Product", "Operations"],
+            "timeline": "4 months",
+            "impact": "Higher average order value"
         }
+    ],
+    "success_metrics": {
+        "conversion_rate": "Target: +20% for each persona",
+        "average_order_value": "Target: +15% through better discovery",
+        "customer_satisfaction": "Target: 4.5+ rating across all personas",
+        "retention_rate": "Target: +25% through personalization"
+    },
+    "resource_requirements": {
+        "engineering_months": "15-20 person-months",
+        "design_resources": "3-4 designers for 6 months",
+        "product_management": "2 senior PMs leading initiatives",
+        "estimated_budget": "R$ 800K - 1.2M for full implementation"
     }
+})
 
 @function_tool
 def create_executive_summary() -> Dict[str, Any]:
     """Create executive summary with key insights and strategic recommendations"""
-    return {
-        "executive_overview": {
-            "key_findings": [
-                "MercadoLivre excels in mobile experience and payment integration",
-                "Three distinct user personas have specific, actionable needs",
-                "Significant opportunity in personalization and discovery",
-                "Strong foundation with clear improvement pathways identified"
-            ],
-            "business_impact": "High - recommendations directly address conversion, retention, and average order value",
-            "implementation_complexity": "Medium - requires coordinated cross-departmental effort",
-            "expected_roi": "15-25% improvement in key metrics within 6 months"
-        },
-        "strategic_priorities": [
-            {
-                "priority": 1,
-                "initiative": "Enhanced Product Discovery",
-                "departments": ["Product", "Engineering"],
-                "timeline": "3 months",
-                "impact": "High conversion improvement"
-            },
-            {
-                "priority": 2,
-                "initiative": "Persona-Based Personalization",
-                "departments": ["Marketing", "Product", "BI"],
-                "timeline": "6 months", 
-                "impact": "Increased engagement and retention"
-            },
-            {
-                "priority": 3,
-                "initiative": "Gift Experience Enhancement",
-                "departments": ["Product", "Operations"],
-                "timeline": "4 months",
-                "impact": "Higher average order value"
-            }
-        ],
-        "success_metrics": {
-            "conversion_rate": "Target: +20% for each persona",
-            "average_order_value": "Target: +15% through better discovery",
-            "customer_satisfaction": "Target: 4.5+ rating across all personas",
-            "retention_rate": "Target: +25% through personalization"
-        },
-        "resource_requirements": {
-            "engineering_months": "15-20 person-months",
-            "design_resources": "3-4 designers for 6 months",
-            "product_management": "2 senior PMs leading initiatives",
-            "estimated_budget": "R$ 800K - 1.2M for full implementation"
-        }
-    }
+    return EXECUTIVE_SUMMARY
 
 agent = Agent(
     name="MercadoLivre Company Analysis Agent",
@@ -289,8 +294,8 @@ agent = Agent(
 )
 
 async def main():
-    result = await Runner.run(agent, "Analyze the MercadoLivre persona feedback data and provide comprehensive departmental recommendations")
-    print("Company Analysis Results:", result.final_output)
+    result = await cached_run(agent, "Analyze the MercadoLivre persona feedback data and provide comprehensive departmental recommendations")
+    print_result("Company Analysis Results:", result)
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_async(main()) 
\ No newline at end of file
@@ -1,21 +1,24 @@
-import asyncio
-import json
-from agents import Agent, Runner, function_tool
-import os
+from agents import Agent, cached_run, print_result, run_async
 
 # Load OpenAI API key from environment variable
-from dotenv import load_dotenv
-load_dotenv()
+from _env import ensure_env
+ensure_env()
 
-@function_tool
-def gather_company_data():
-    return {"revenue": 450000, "customers": 15420, "growth": "12%"}
+COMPANY_REVENUE = 450000
+COMPANY_CUSTOMERS = 15420
+COMPANY_GROWTH = "12%"
 
-agent = Agent(name="Company Context Agent", instructions="Analyze company context", tools=[gather_company_data])
+agent = Agent(
+    name="Company Context Agent",
+    instructions=(
+        "Analyze company context. "
+        f"Company data: revenue={COMPANY_REVENUE}, customers={COMPANY_CUSTOMERS}, growth={COMPANY_GROWTH}"
+    ),
+)
 
 async def main():
-    result = await Runner.run(agent, "Analyze our company performance")
-    print("Company Context:", result.final_output)
+    result = await cached_run(agent, "Analyze our company performance")
+    print_result("Company Context:", result)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_async(main())
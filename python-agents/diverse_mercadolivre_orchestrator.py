@@ -1,11 +1,15 @@
 import asyncio
+import hashlib
 import json
+import logging
+import logging.handlers
+import queue
 import random
+import sys
 import websockets
 import os
-from agents import Agent, Runner, function_tool
+from agents import Agent, Runner, cached_run, function_tool, run_async
 from datetime import datetime
-import uuid
 
 # Import all agents
 from mercadolivre_context_agent import agent as ml_context_agent
@@ -15,12 +19,117 @@ from oversight_agent import agent as oversight_agent
 from diverse_persona_agent import DiversePersonaAgent
 
 # Load OpenAI API key from environment variable
-from dotenv import load_dotenv
-load_dotenv()
+from _env import ensure_env
+ensure_env()
+
+try:
+    import orjson
+
+    def _dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    def _dumps_indented(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+    _loads = json.loads
+
+logger = logging.getLogger('ml_diverse_orchestrator')
+
+def start_log_listener(level=logging.INFO):
+    """
+    Route this module's log records through a queue so coroutines never block on stdout
+
+    Returns:
+        The running QueueListener; call stop() on it to flush remaining records
+    """
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(level)
+    logger.propagate = False
+    listener.start()
+    return listener
 
 # API key prefix
 API_KEY_PREFIX = "mcp_agent_"
 
+# Mock persona attributes
+PERSONA_TYPES = (
+    "tech_enthusiast", "budget_shopper", "gift_buyer",
+    "family_shopper", "business_buyer", "senior_shopper", "luxury_shopper"
+)
+
+FIRST_NAMES = (
+    "James", "Maria", "John", "Patricia", "Robert", "Jennifer", "Michael",
+    "Linda", "William", "Elizabeth", "David", "Susan", "Richard", "Jessica"
+)
+
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller",
+    "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez"
+)
+
+AGE_RANGES = ("18-24", "25-34", "35-44", "45-54", "55-64", "65+")
+INCOME_LEVELS = ("low", "medium", "high", "very_high")
+SHOPPING_FREQUENCIES = ("daily", "weekly", "monthly", "rarely")
+DEVICES = ("mobile", "desktop", "tablet")
+CATEGORIES = (
+    "electronics", "home", "fashion", "toys", "sports", "automotive",
+    "books", "health", "beauty", "groceries", "office"
+)
+IMPORTANT_FACTORS = ("price", "quality", "speed", "service")
+PAYMENT_METHODS = ("credit", "debit", "pix", "installments")
+
+# Session length in minutes for each exploration time
+TIME_SPENT_RANGES = {"brief": (5, 10), "medium": (15, 25), "lengthy": (30, 50)}
+
+# 1-10 scores drawn for each persona
+SCORE_VALUES = range(1, 11)
+SCORES_PER_PERSONA = 5
+
+# Interviews run per exploration, kept small for demo purposes
+DEFAULT_INTERVIEW_LIMIT = 5
+
+class AsyncMemo:
+    """
+    Runner.run memoized in memory, with concurrent identical calls sharing one run
+
+    Calls are keyed on the agent's name, instructions and tools plus the prompt,
+    so a rebound persona agent never reuses another persona's answer.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._cache = {}
+        self._locks = {}
+
+    async def run(self, agent, prompt):
+        key = hashlib.blake2b(
+            f"{agent.name}\0{agent.instructions}\0{agent.tools_info}\0{prompt}".encode(),
+            digest_size=16,
+        ).digest()
+        if key in self._cache:
+            return self._cache[key]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have finished the same run while we waited
+            if key in self._cache:
+                return self._cache[key]
+            try:
+                result = await Runner.run(agent, prompt)
+            finally:
+                self._locks.pop(key, None)
+            if len(self._cache) >= self.maxsize:
+                # Dicts keep insertion order, so this drops the oldest entry
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = result
+            return result
+
 # Database service for loading personas
 class DatabaseService:
     """Simulated database service for loading personas"""
@@ -44,69 +153,59 @@ class DatabaseService:
         if exploration_filter and exploration_filter in exploration_times:
             exploration_times = [exploration_filter]
             
-        personas = []
-        
-        # Sample persona types
-        persona_types = [
-            "tech_enthusiast", "budget_shopper", "gift_buyer", 
-            "family_shopper", "business_buyer", "senior_shopper", "luxury_shopper"
-        ]
+        # Draw every single-pick attribute for the whole batch up front
+        explorations = random.choices(exploration_times, k=count)
+        first_names = random.choices(FIRST_NAMES, k=count)
+        last_names = random.choices(LAST_NAMES, k=count)
+        types = random.choices(PERSONA_TYPES, k=count)
+        ages = random.choices(AGE_RANGES, k=count)
+        incomes = random.choices(INCOME_LEVELS, k=count)
+        frequencies = random.choices(SHOPPING_FREQUENCIES, k=count)
+        devices = random.choices(DEVICES, k=count)
+        scores = random.choices(SCORE_VALUES, k=count * SCORES_PER_PERSONA)
+        category_counts = random.choices(range(2, 5), k=count)
+        factor_counts = random.choices(range(2, 5), k=count)
+        payment_counts = random.choices(range(1, 5), k=count)
         
-        # Sample names
-        first_names = [
-            "James", "Maria", "John", "Patricia", "Robert", "Jennifer", "Michael",
-            "Linda", "William", "Elizabeth", "David", "Susan", "Richard", "Jessica"
-        ]
+        # Every persona in a batch shares one creation timestamp
+        now_iso = datetime.now().isoformat()
+        # One OS entropy read yields the 8-hex-char ids for the whole batch
+        ids = os.urandom(4 * count).hex()
         
-        last_names = [
-            "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller",
-            "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez"
-        ]
+        personas = []
         
         for i in range(count):
             # Create a diverse set of personas
-            exploration_time = random.choice(exploration_times)
+            exploration_time = explorations[i]
             
             # Time spent depends on exploration time
-            if exploration_time == "brief":
-                time_spent = random.randint(5, 10)
-            elif exploration_time == "medium":
-                time_spent = random.randint(15, 25)
-            else:  # lengthy
-                time_spent = random.randint(30, 50)
+            time_spent = random.randint(*TIME_SPENT_RANGES[exploration_time])
+            tech_savviness, price_sensitivity, research_depth, decision_speed, social_influence = (
+                scores[i * SCORES_PER_PERSONA:(i + 1) * SCORES_PER_PERSONA]
+            )
                 
             persona = {
-                "persona_id": f"persona_{uuid.uuid4().hex[:8]}",
-                "name": f"{random.choice(first_names)} {random.choice(last_names)}",
-                "type": random.choice(persona_types),
+                "persona_id": f"persona_{ids[i * 8:(i + 1) * 8]}",
+                "name": f"{first_names[i]} {last_names[i]}",
+                "type": types[i],
                 "characteristics": {
-                    "age_range": random.choice(["18-24", "25-34", "35-44", "45-54", "55-64", "65+"]),
-                    "income_level": random.choice(["low", "medium", "high", "very_high"]),
-                    "tech_savviness": random.randint(1, 10),
-                    "price_sensitivity": random.randint(1, 10),
-                    "research_depth": random.randint(1, 10),
-                    "decision_speed": random.randint(1, 10)
+                    "age_range": ages[i],
+                    "income_level": incomes[i],
+                    "tech_savviness": tech_savviness,
+                    "price_sensitivity": price_sensitivity,
+                    "research_depth": research_depth,
+                    "decision_speed": decision_speed
                 },
                 "preferences": {
-                    "preferred_categories": random.sample(
-                        ["electronics", "home", "fashion", "toys", "sports", "automotive", 
-                         "books", "health", "beauty", "groceries", "office"], 
-                        k=random.randint(2, 4)
-                    ),
-                    "important_factors": random.sample(
-                        ["price", "quality", "speed", "service"], 
-                        k=random.randint(2, 4)
-                    ),
-                    "payment_preferences": random.sample(
-                        ["credit", "debit", "pix", "installments"], 
-                        k=random.randint(1, 4)
-                    )
+                    "preferred_categories": random.sample(CATEGORIES, k=category_counts[i]),
+                    "important_factors": random.sample(IMPORTANT_FACTORS, k=factor_counts[i]),
+                    "payment_preferences": random.sample(PAYMENT_METHODS, k=payment_counts[i])
                 },
                 "behaviors": {
-                    "shopping_frequency": random.choice(["daily", "weekly", "monthly", "rarely"]),
+                    "shopping_frequency": frequencies[i],
                     "average_session_duration": time_spent,
-                    "device_preference": random.choice(["mobile", "desktop", "tablet"]),
-                    "social_influence": random.randint(1, 10)
+                    "device_preference": devices[i],
+                    "social_influence": social_influence
                 },
                 "customization": {
                     "custom_attributes": {
@@ -114,8 +213,8 @@ class DatabaseService:
                         "time_spent_minutes": time_spent
                     }
                 },
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
+                "created_at": now_iso,
+                "updated_at": now_iso,
                 "is_active": True
             }
             
@@ -123,6 +222,20 @@ class DatabaseService:
             
         return personas
 
+def _coerce_interview_output(output):
+    """Turn a persona agent's interview output into a dict of responses"""
+    if isinstance(output, dict):
+        return output
+    if isinstance(output, str):
+        # Try to parse JSON if it's a string
+        try:
+            parsed = _loads(output)
+        except json.JSONDecodeError:  # orjson raises a subclass of it
+            # If parsing fails, treat the whole output as the response
+            return {"interview_response": output}
+        return parsed if isinstance(parsed, dict) else {}
+    return {"interview_response": str(output)}
+
 class MercadoLivreExplorationOrchestrator:
     """Orchestrates diverse persona explorations of MercadoLivre with interactive agent flow"""
 
@@ -132,130 +245,143 @@ class MercadoLivreExplorationOrchestrator:
         self.feedback_collection_agent = ml_comm_agent  # Renamed from comm_agent
         self.data_agent = company_analysis_agent  # Will be used as the data analysis agent
         self.oversight_agent = oversight_agent
+        # Identical agent calls, within a run or across runs, execute once
+        self._memo = AsyncMemo()
+        # Idle persona agents, rebound to a new persona for each interview
+        self._idle_persona_agents = []
 
-    async def run_exploration_with_diverse_personas(self, persona_count=15):
+    async def run_exploration_with_diverse_personas(self, persona_count=15, interview_limit=DEFAULT_INTERVIEW_LIMIT):
         """
         Run a comprehensive MercadoLivre exploration using diverse personas
         with an interactive flow between specialized agents
 
         Args:
             persona_count: Number of personas to include in exploration
+            interview_limit: Maximum number of loaded personas to interview
 
         Returns:
             Comprehensive exploration results
         """
-        print("🛒 Starting MercadoLivre Interactive Agent Exploration")
-        print("=" * 70)
+        logger.info("🛒 Starting MercadoLivre Interactive Agent Exploration")
+        logger.info("=" * 70)
 
         start_time = datetime.now()
 
+        # Loading personas doesn't depend on any agent output, so start it before Phase 1
+        personas_task = asyncio.create_task(self.database.load_personas(count=persona_count))
+
         # Phase 1: Company Context Agent gathers market intelligence
-        print("\n🏢 Phase 1: Company Context Agent Gathering Market Intelligence...")
-        context_result = await Runner.run(
+        logger.info("\n🏢 Phase 1: Company Context Agent Gathering Market Intelligence...")
+        context_result = await self._memo.run(
             self.company_context_agent,
             "As the Company Context Agent, provide comprehensive MercadoLivre marketplace context including categories, stats, user behavior patterns, and competitive positioning. This context will be provided to the Feedback Collection Agent to inform their research."
         )
-        print(f"Company Context Agent Analysis: {context_result.final_output}")
+        logger.info("Company Context Agent Analysis: %s", context_result.final_output)
 
         # Extract market context for passing to other agents
         market_context = context_result.final_output
-        print("\n💼 Company Context Agent providing market context to Feedback Collection Agent...")
+        # Prompts that carry the context open with this same block, so providers can reuse the cached prefix
+        ctx_block = f"Market Context from the Company Context Agent:\n{market_context}\n\n"
+        logger.info("\n💼 Company Context Agent providing market context to Feedback Collection Agent...")
 
-        # Phase 2: Feedback Collection Agent prepares research based on context
-        print("\n🎙️ Phase 2: Feedback Collection Agent Planning Research...")
-        research_plan_result = await Runner.run(
-            self.feedback_collection_agent,
-            f"As the Feedback Collection Agent, use this market context from the Company Context Agent to develop a research plan for interviewing different MercadoLivre shopper personas: {market_context}\n\nCreate specific interview questions and research methodologies."
-        )
-        print(f"Feedback Collection Agent Research Plan: {research_plan_result.final_output}")
-
-        # Phase 3: Load diverse personas from database
-        print("\n👥 Phase 3: Feedback Collection Agent Loading Diverse Personas...")
-        personas = await self.database.load_personas(count=persona_count)
-        print(f"Loaded {len(personas)} diverse personas for interviews")
+        # Phase 2: Load diverse personas from database
+        logger.info("\n👥 Phase 2: Feedback Collection Agent Loading Diverse Personas...")
+        personas = await personas_task
+        logger.info(f"Loaded {len(personas)} diverse personas for interviews")
 
         # Display summary of personas by exploration time
         brief_personas = len([p for p in personas if p['customization']['custom_attributes']['exploration_time'] == 'brief'])
         medium_personas = len([p for p in personas if p['customization']['custom_attributes']['exploration_time'] == 'medium'])
         lengthy_personas = len([p for p in personas if p['customization']['custom_attributes']['exploration_time'] == 'lengthy'])
 
-        print(f"Persona Distribution:")
-        print(f"  - Brief interviews (5-10 min): {brief_personas}")
-        print(f"  - Medium interviews (15-25 min): {medium_personas}")
-        print(f"  - Thorough interviews (30-50 min): {lengthy_personas}")
+        logger.info("Persona Distribution:")
+        logger.info(f"  - Brief interviews (5-10 min): {brief_personas}")
+        logger.info(f"  - Medium interviews (15-25 min): {medium_personas}")
+        logger.info(f"  - Thorough interviews (30-50 min): {lengthy_personas}")
 
-        # Phase 4: Feedback Collection Agent conducts interviews
-        print("\n🔍 Phase 4: Feedback Collection Agent Conducting Interviews...")
+        # Phase 3: Feedback Collection Agent conducts interviews
+        logger.info("\n🔍 Phase 3: Feedback Collection Agent Conducting Interviews...")
 
-        # Prepare interview prompts using research plan
-        interview_prompts = {}
+        # Prepare interview prompts for each persona type
         persona_types = list(set([p['type'] for p in personas]))
 
-        for persona_type in persona_types:
-            interview_prompts[persona_type] = await Runner.run(
+        async def prepare_interview_prompt(persona_type):
+            # Prompts depend only on the persona type, so repeat runs can reuse them from disk
+            result = await cached_run(
                 self.feedback_collection_agent,
-                f"As the Feedback Collection Agent, prepare specific interview questions for the {persona_type} persona based on your research plan. These questions should help uncover their unique shopping behaviors and pain points."
+                f"As the Feedback Collection Agent, prepare specific interview questions for the {persona_type} persona. These questions should help uncover their unique shopping behaviors and pain points."
             )
-            print(f"Prepared interview questions for {persona_type} persona")
+            logger.info(f"Prepared interview questions for {persona_type} persona")
+            return result
 
-        # Create tasks for each persona's interview
-        interview_tasks = []
-        for persona in personas:
-            # Use the interview prompts specific to this persona type
-            persona_type = persona['type']
-            interview_prompt = interview_prompts[persona_type].final_output
-
-            task = self.interview_persona(persona, interview_prompt, market_context)
-            interview_tasks.append(task)
+        # Prompt preparation for each persona type is independent, so run them concurrently
+        prepared_prompts = await asyncio.gather(
+            *(prepare_interview_prompt(persona_type) for persona_type in persona_types)
+        )
+        interview_prompts = dict(zip(persona_types, prepared_prompts))
+
+        # Interview the selected personas concurrently, each with the prompts for its type
+        selected = personas[:interview_limit]
+        logger.info("\nStarting persona interviews...")
+        interview_results = await asyncio.gather(
+            *(
+                self.interview_persona(persona, interview_prompts[persona['type']].final_output, market_context)
+                for persona in selected
+            ),
+            return_exceptions=True
+        )
 
-        # Run all interviews in series to simulate conversation flow
-        print("\nStarting persona interviews...")
         persona_results = []
-        for task in interview_tasks[:min(5, len(interview_tasks))]:  # Limit to 5 interviews for demo purposes
-            result = await task
-            persona_results.append(result)
-            print(f"Completed interview with {result['name']} ({result['type']} persona)")
+        for persona, result in zip(selected, interview_results):
+            if isinstance(result, Exception):
+                logger.error(f"Interview with {persona['name']} failed: {result}")
+            else:
+                persona_results.append(result)
+        # Group interview results by persona type; the keys are the types interviewed
+        persona_feedback = {}
+        for r in persona_results:
+            persona_feedback.setdefault(r['type'], []).append(r)
+        persona_types_seen = list(persona_feedback)
 
-        # Phase 5: Feedback Collection Agent processes results for Data Agent
-        print("\n📊 Phase 5: Feedback Collection Agent Processing Interview Results...")
+        # Phase 4: Feedback Collection Agent processes results for Data Agent
+        logger.info("\n📊 Phase 4: Feedback Collection Agent Processing Interview Results...")
 
         # Combine all interview results into a structured format
         all_interview_data = {
             "interviews": persona_results,
             "interview_count": len(persona_results),
-            "persona_types": list(set([r['type'] for r in persona_results])),
-            "market_context": market_context
+            "persona_types": persona_types_seen
         }
 
         # Feedback Collection Agent processes and summarizes interviews
-        processed_feedback = await Runner.run(
+        processed_feedback = await self._memo.run(
             self.feedback_collection_agent,
-            f"As the Feedback Collection Agent, process these interview results and prepare a structured summary for the Data Agent to analyze: {json.dumps(all_interview_data, indent=2)}"
+            f"{ctx_block}As the Feedback Collection Agent, process these interview results and prepare a structured summary for the Data Agent to analyze: {_dumps_indented(all_interview_data)}"
         )
 
-        print("Feedback Collection Agent has processed interview results for Data Agent")
+        logger.info("Feedback Collection Agent has processed interview results for Data Agent")
 
-        # Phase 6: Data Agent analyzes processed feedback
-        print("\n📈 Phase 6: Data Agent Analyzing Processed Feedback...")
+        # Phase 5: Data Agent analyzes processed feedback
+        logger.info("\n📈 Phase 5: Data Agent Analyzing Processed Feedback...")
 
         # Data Agent receives both market context and processed feedback
-        data_analysis_result = await Runner.run(
+        data_analysis_result = await self._memo.run(
             self.data_agent,
-            f"As the Data Agent, analyze this processed feedback from the Feedback Collection Agent along with the original market context from the Company Context Agent. Identify patterns, insights, and generate recommendations.\n\nMarket Context: {market_context}\n\nProcessed Feedback: {processed_feedback.final_output}"
+            f"{ctx_block}As the Data Agent, analyze this processed feedback from the Feedback Collection Agent along with the original market context from the Company Context Agent. Identify patterns, insights, and generate recommendations.\n\nProcessed Feedback: {processed_feedback.final_output}"
         )
 
-        print("Data Agent completed analysis of feedback data")
-        print(f"Data Analysis: {data_analysis_result.final_output}")
+        logger.info("Data Agent completed analysis of feedback data")
+        logger.info("Data Analysis: %s", data_analysis_result.final_output)
 
-        # Phase 7: Generate final recommendations based on all agent inputs
-        print("\n🏆 Phase 7: Generating Final Recommendations...")
+        # Phase 6: Generate final recommendations based on all agent inputs
+        logger.info("\n🏆 Phase 6: Generating Final Recommendations...")
 
-        final_recommendations = await Runner.run(
+        final_recommendations = await self._memo.run(
             self.oversight_agent,
-            f"Review and consolidate the inputs from all three agents to generate final prioritized recommendations:\n\n1. Company Context Agent market analysis: {market_context}\n\n2. Feedback Collection Agent processed interviews: {processed_feedback.final_output}\n\n3. Data Agent analysis: {data_analysis_result.final_output}"
+            f"{ctx_block}Review and consolidate the inputs from all three agents to generate final prioritized recommendations:\n\n1. Company Context Agent market analysis: see the Market Context above\n\n2. Feedback Collection Agent processed interviews: {processed_feedback.final_output}\n\n3. Data Agent analysis: {data_analysis_result.final_output}"
         )
 
-        print(f"Final Recommendations: {final_recommendations.final_output}")
+        logger.info("Final Recommendations: %s", final_recommendations.final_output)
 
         # Calculate total exploration time
         end_time = datetime.now()
@@ -263,18 +389,20 @@ class MercadoLivreExplorationOrchestrator:
         duration_minutes = duration.total_seconds() / 60
 
         # Final Summary
-        print("\n" + "=" * 70)
-        print("🎯 INTERACTIVE AGENT ANALYSIS COMPLETE")
-        print("=" * 70)
-        print(f"✅ Company Context Agent: Market analysis completed")
-        print(f"✅ Feedback Collection Agent: {len(persona_results)} personas interviewed")
-        print(f"✅ Data Agent: Analysis completed with insights and patterns")
-        print(f"✅ Total Interview Time: {duration_minutes:.2f} minutes")
+        logger.info("\n" + "=" * 70)
+        logger.info("🎯 INTERACTIVE AGENT ANALYSIS COMPLETE")
+        logger.info("=" * 70)
+        logger.info(f"✅ Company Context Agent: Market analysis completed")
+        logger.info(f"✅ Feedback Collection Agent: {len(persona_results)} personas interviewed")
+        logger.info(f"✅ Data Agent: Analysis completed with insights and patterns")
+        logger.info(f"✅ Total Interview Time: {duration_minutes:.2f} minutes")
 
         return {
             "exploration_complete": True,
             "personas_interviewed": len(persona_results),
-            "persona_types": list(set([r['type'] for r in persona_results])),
+            "personas_participated": len(persona_results),
+            "persona_types": persona_types_seen,
+            "persona_feedback": persona_feedback,
             "company_context": market_context,
             "processed_feedback": processed_feedback.final_output,
             "data_analysis": data_analysis_result.final_output,
@@ -294,37 +422,31 @@ class MercadoLivreExplorationOrchestrator:
         Returns:
             Interview results with this persona
         """
-        # Create a persona-specific agent
-        persona_agent = DiversePersonaAgent(persona_config)
-
-        # Get persona summary
-        summary = persona_agent.get_persona_summary()
-        print(f"Feedback Collection Agent interviewing {summary['name']} ({summary['type']}, {summary['exploration_style']} explorer)")
+        # Reuse an idle persona agent; concurrent interviews each hold their own
+        if self._idle_persona_agents:
+            persona_agent = self._idle_persona_agents.pop().bind(persona_config)
+        else:
+            persona_agent = DiversePersonaAgent(persona_config)
 
-        # Conduct the interview using the Feedback Collection Agent's questions
-        interview_response = await Runner.run(
-            persona_agent,
-            f"You are participating in an interview with the Feedback Collection Agent about your MercadoLivre shopping experience. Please answer these questions from your persona's perspective:\n\n{interview_prompt}"
-        )
+        try:
+            # Get persona summary
+            summary = persona_agent.get_persona_summary()
+            logger.info(f"Feedback Collection Agent interviewing {summary['name']} ({summary['type']}, {summary['exploration_style']} explorer)")
+
+            # Conduct the interview using the Feedback Collection Agent's questions
+            interview_response = await self._memo.run(
+                persona_agent,
+                f"You are participating in an interview with the Feedback Collection Agent about your MercadoLivre shopping experience. Please answer these questions from your persona's perspective:\n\n{interview_prompt}"
+            )
+        finally:
+            self._idle_persona_agents.append(persona_agent)
 
         # Process and return results
         try:
-            interview_data = {}
-
             # Extract responses from the interview
-            if isinstance(interview_response.final_output, dict):
-                interview_data = interview_response.final_output
-            elif isinstance(interview_response.final_output, str):
-                # Try to parse JSON if it's a string
-                try:
-                    parsed = json.loads(interview_response.final_output)
-                    if isinstance(parsed, dict):
-                        interview_data = parsed
-                except:
-                    # If parsing fails, treat the whole output as the response
-                    interview_data = {"interview_response": interview_response.final_output}
-            else:
-                interview_data = {"interview_response": str(interview_response.final_output)}
+            interview_data = _coerce_interview_output(interview_response.final_output)
+
+            logger.info(f"Completed interview with {persona_config['name']} ({persona_config['type']} persona)")
 
             # Add persona information
             return {
@@ -338,7 +460,7 @@ class MercadoLivreExplorationOrchestrator:
             }
 
         except Exception as e:
-            print(f"Error processing interview results for {persona_config['name']}: {e}")
+            logger.error(f"Error processing interview results for {persona_config['name']}: {e}")
             return {
                 "persona_id": persona_config['persona_id'],
                 "name": persona_config['name'],
@@ -363,7 +485,7 @@ class MercadoLivreExplorationOrchestrator:
         
         # Get persona summary
         summary = persona_agent.get_persona_summary()
-        print(f"Starting exploration as {summary['name']} ({summary['type']}, {summary['exploration_style']} explorer)")
+        logger.info(f"Starting exploration as {summary['name']} ({summary['type']}, {summary['exploration_style']} explorer)")
         
         # Generate exploration prompts based on persona type
         if persona_config['type'] == 'tech_enthusiast':
@@ -384,7 +506,7 @@ class MercadoLivreExplorationOrchestrator:
             prompt = "Explore MercadoLivre marketplace focusing on your preferred categories and shopping behaviors."
         
         # Run the exploration
-        result = await Runner.run(persona_agent, prompt)
+        result = await self._memo.run(persona_agent, prompt)
         
         # Process and return results
         try:
@@ -396,10 +518,10 @@ class MercadoLivreExplorationOrchestrator:
             elif isinstance(result.final_output, str):
                 # Try to parse JSON if it's a string
                 try:
-                    parsed = json.loads(result.final_output)
+                    parsed = _loads(result.final_output)
                     if isinstance(parsed, dict):
                         observations = parsed.get('observations', [])
-                except:
+                except json.JSONDecodeError:
                     # If parsing fails, treat the whole output as one observation
                     observations = [result.final_output]
             else:
@@ -419,7 +541,7 @@ class MercadoLivreExplorationOrchestrator:
             }
             
         except Exception as e:
-            print(f"Error processing results for {persona_config['name']}: {e}")
+            logger.error(f"Error processing results for {persona_config['name']}: {e}")
             return {
                 "persona_id": persona_config['persona_id'],
                 "name": persona_config['name'],
@@ -433,17 +555,21 @@ async def connect_agents_to_platform():
     """Connect all MercadoLivre agents to the MCP platform"""
     uri = "ws://localhost:3001/api/v1/ws"
     
-    print("\n🔗 Connecting MercadoLivre agents to platform...")
+    logger.info("\n🔗 Connecting MercadoLivre agents to platform...")
     
     try:
         # In a real implementation, this would establish WebSocket connections
-        print(f"✅ Successfully connected agents to WebSocket platform at {uri}")
+        logger.info(f"✅ Successfully connected agents to WebSocket platform at {uri}")
     except Exception as e:
-        print(f"❌ WebSocket connection failed: {e}")
+        logger.error(f"❌ WebSocket connection failed: {e}")
 
 async def main():
     """Main entry point for diverse MercadoLivre exploration"""
     
+    # Let tasks that finish without blocking skip a trip through the event loop (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     # Create orchestrator
     orchestrator = MercadoLivreExplorationOrchestrator()
     
@@ -453,11 +579,15 @@ async def main():
     # Connect to platform for real-time updates (optional)
     # await connect_agents_to_platform()
     
-    print(f"\n🎊 MercadoLivre diverse persona analysis completed successfully!")
-    print(f"📊 Total insights collected from {exploration_results['personas_participated']} personas")
-    print(f"🏢 Departmental recommendations generated across {len(exploration_results['persona_feedback'])} persona types")
+    logger.info(f"\n🎊 MercadoLivre diverse persona analysis completed successfully!")
+    logger.info(f"📊 Total insights collected from {exploration_results['personas_participated']} personas")
+    logger.info(f"🏢 Departmental recommendations generated across {len(exploration_results['persona_feedback'])} persona types")
     
     return exploration_results
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    log_listener = start_log_listener()
+    try:
+        run_async(main())
+    finally:
+        log_listener.stop()
\ No newline at end of file
@@ -1,7 +1,6 @@
 import asyncio
 import json
 import random
-import time
 from agents import Agent, function_tool, Runner, AgentResult
 
 class DiversePersonaAgent(Agent):
@@ -11,6 +10,27 @@ class DiversePersonaAgent(Agent):
     """
 
     def __init__(self, persona_config=None):
+        # Set up tools
+        self.tools = [
+            self.browse_category,
+            self.search_products,
+            self.check_product_details,
+            self.add_to_cart,
+            self.checkout_process,
+            self.analyze_marketplace
+        ]
+        self.bind(persona_config)
+    
+    def bind(self, persona_config):
+        """
+        Switch this agent to a different persona, keeping its tools
+        
+        Args:
+            persona_config: Persona configuration from database, or None for a generic persona
+            
+        Returns:
+            This agent, now acting as the given persona
+        """
         # Extract name and create instructions from persona data
         persona_name = persona_config.get('name', 'Generic Persona') if persona_config else 'Generic Persona'
         persona_type = persona_config.get('type', 'generic') if persona_config else 'generic'
@@ -18,33 +38,25 @@ class DiversePersonaAgent(Agent):
         instructions = f"You are a {persona_type} shopper named {persona_name}. "
         instructions += "Explore MercadoLivre and provide feedback based on your persona characteristics."
 
-        super().__init__(name=persona_name, instructions=instructions)
+        # The base initializer also re-derives the agent kind from the new name
+        super().__init__(name=persona_name, instructions=instructions, tools=self.tools)
         self.persona = persona_config or {}
         self.exploration_time = self.persona.get('customization', {}).get(
             'custom_attributes', {}).get('exploration_time', 'medium')
         self.time_spent_minutes = int(self.persona.get('customization', {}).get(
             'custom_attributes', {}).get('time_spent_minutes', 20))
-        
-        # Set up tools
-        self.tools = [
-            self.browse_category,
-            self.search_products,
-            self.check_product_details,
-            self.add_to_cart,
-            self.checkout_process,
-            self.analyze_marketplace
-        ]
+        return self
     
     async def run(self, prompt: str) -> AgentResult:
         """Run the agent with the given prompt"""
         return await Runner.run(self, prompt)
 
     @function_tool
-    def browse_category(self, category: str) -> dict:
+    async def browse_category(self, category: str) -> dict:
         """Simulates browsing a specific category on MercadoLivre"""
         # Simulate variable exploration time based on persona preferences
         exploration_seconds = self._calculate_exploration_time(base_time=2)
-        time.sleep(exploration_seconds)
+        await asyncio.sleep(exploration_seconds)
         
         return {
             "category": category,
@@ -54,11 +66,11 @@ class DiversePersonaAgent(Agent):
         }
     
     @function_tool
-    def search_products(self, query: str) -> dict:
+    async def search_products(self, query: str) -> dict:
         """Simulates searching for products on MercadoLivre"""
         # Simulate variable exploration time based on persona preferences
         exploration_seconds = self._calculate_exploration_time(base_time=1.5)
-        time.sleep(exploration_seconds)
+        await asyncio.sleep(exploration_seconds)
         
         return {
             "query": query,
@@ -68,11 +80,11 @@ class DiversePersonaAgent(Agent):
         }
     
     @function_tool
-    def check_product_details(self, product_id: str) -> dict:
+    async def check_product_details(self, product_id: str) -> dict:
         """Simulates examining a product's details page"""
         # Simulate variable exploration time based on persona preferences
         exploration_seconds = self._calculate_exploration_time(base_time=3)
-        time.sleep(exploration_seconds)
+        await asyncio.sleep(exploration_seconds)
         
         # Simulate different depth of review reading based on persona
         review_count = 0
@@ -92,11 +104,11 @@ class DiversePersonaAgent(Agent):
         }
     
     @function_tool
-    def add_to_cart(self, product_id: str) -> dict:
+    async def add_to_cart(self, product_id: str) -> dict:
         """Simulates adding a product to cart"""
         # Simulate variable decision time based on persona preferences
         decision_time = self._calculate_exploration_time(base_time=1, variance=0.5)
-        time.sleep(decision_time)
+        await asyncio.sleep(decision_time)
         
         return {
             "product_id": product_id,
@@ -105,7 +117,7 @@ class DiversePersonaAgent(Agent):
         }
     
     @function_tool
-    def checkout_process(self) -> dict:
+    async def checkout_process(self) -> dict:
         """Simulates going through checkout process"""
         # Different personas spend different amounts of time in checkout
         if self.exploration_time == "brief":
@@ -115,7 +127,7 @@ class DiversePersonaAgent(Agent):
         else:  # lengthy
             checkout_time = random.uniform(4, 8)
             
-        time.sleep(checkout_time)
+        await asyncio.sleep(checkout_time)
         
         return {
             "checkout_time_seconds": checkout_time,
@@ -125,14 +137,14 @@ class DiversePersonaAgent(Agent):
         }
     
     @function_tool
-    def analyze_marketplace(self, focus_area: str) -> dict:
+    async def analyze_marketplace(self, focus_area: str) -> dict:
         """Performs analysis on a specific area of the marketplace"""
         # Thorough personas spend more time on analysis
         analysis_time = self._calculate_exploration_time(
             base_time=5, 
             multiplier=2 if self.exploration_time == "lengthy" else 1
         )
-        time.sleep(analysis_time)
+        await asyncio.sleep(analysis_time)
         
         analysis_depth = "surface"
         if self.exploration_time == "medium":
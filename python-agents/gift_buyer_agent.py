@@ -1,10 +1,10 @@
 import asyncio
 import json
-from agents import Agent, Runner, function_tool
+from agents import Agent, Runner, function_tool, print_result
 from typing import Dict, List, Any
 import os
-from dotenv import load_dotenv
-load_dotenv()
+from _env import ensure_env
+ensure_env()
 
 @function_tool
 def explore_gift_categories() -> Dict[str, Any]:
@@ -119,7 +119,7 @@ agent = Agent(
 
 async def main():
     result = await Runner.run(agent, "Explore MercadoLivre's gift-buying experience and evaluate gift services")
-    print("Gift Buyer Feedback:", result.final_output)
+    print_result("Gift Buyer Feedback:", result)
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
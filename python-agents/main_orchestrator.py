@@ -1,15 +1,15 @@
 import asyncio
 import json
 import websockets
-from agents import Agent, Runner, function_tool
+from agents import Agent, Runner, function_tool, run_async
 from company_context_agent import agent as context_agent
 from communication_agent import agent as comm_agent
 from oversight_agent import agent as oversight_agent
 import os
 
 # Load OpenAI API key from environment variable
-from dotenv import load_dotenv
-load_dotenv()
+from _env import ensure_env
+ensure_env()
 
 # Agent API keys from your platform
 API_KEYS = {
@@ -93,4 +93,4 @@ async def main():
     )
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_async(main())
\ No newline at end of file
@@ -1,11 +1,11 @@
 import asyncio
 import json
-from agents import Agent, Runner, function_tool
+from agents import Agent, Runner, function_tool, print_result
 from typing import Dict, List, Any
 import requests
 import os
-from dotenv import load_dotenv
-load_dotenv()
+from _env import ensure_env
+ensure_env()
 
 @function_tool
 def get_mercadolivre_categories() -> Dict[str, Any]:
@@ -68,7 +68,7 @@ agent = Agent(
 
 async def main():
     result = await Runner.run(agent, "Provide comprehensive MercadoLivre marketplace context")
-    print("MercadoLivre Context:", result.final_output)
+    print_result("MercadoLivre Context:", result)
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
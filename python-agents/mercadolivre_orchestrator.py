@@ -1,7 +1,7 @@
 import asyncio
 import json
 import websockets
-from agents import Agent, Runner, function_tool
+from agents import Agent, Runner, function_tool, run_async
 import os
 
 # Import all MercadoLivre agents
@@ -14,8 +14,8 @@ from company_analysis_agent import agent as company_analysis_agent
 from oversight_agent import agent as oversight_agent
 
 # Load OpenAI API key from environment variable
-from dotenv import load_dotenv
-load_dotenv()
+from _env import ensure_env
+ensure_env()
 
 # MercadoLivre Agent API keys
 ML_API_KEYS = {
@@ -52,29 +52,27 @@ async def run_mercadolivre_exploration():
     
     # Phase 3: Parallel Agent Exploration
     print("\n🔍 Phase 3: Multi-Persona Exploration...")
-    
-    # Tech Enthusiast Exploration
     print("\n💻 Tech Enthusiast Agent Exploring...")
-    tech_result = await Runner.run(
-        tech_agent,
-        "Explore MercadoLivre's electronics section focusing on product specifications, tech trends, and technical shopping experience. Provide detailed feedback on the tech enthusiast experience."
-    )
-    print(f"Tech Enthusiast Feedback: {tech_result.final_output}")
-    
-    # Budget Shopper Exploration  
     print("\n💰 Budget Shopper Agent Exploring...")
-    budget_result = await Runner.run(
-        budget_agent,
-        "Hunt for deals and evaluate value propositions across MercadoLivre. Focus on pricing transparency, discount mechanisms, and overall value for money experience."
-    )
-    print(f"Budget Shopper Feedback: {budget_result.final_output}")
-    
-    # Gift Buyer Exploration
     print("\n🎁 Gift Buyer Agent Exploring...")
-    gift_result = await Runner.run(
-        gift_agent,
-        "Explore MercadoLivre's gift-buying experience including gift categories, services, delivery options, and overall gifting ecosystem."
+    
+    # The persona agents don't depend on each other, so they explore concurrently
+    tech_result, budget_result, gift_result = await asyncio.gather(
+        Runner.run(
+            tech_agent,
+            "Explore MercadoLivre's electronics section focusing on product specifications, tech trends, and technical shopping experience. Provide detailed feedback on the tech enthusiast experience."
+        ),
+        Runner.run(
+            budget_agent,
+            "Hunt for deals and evaluate value propositions across MercadoLivre. Focus on pricing transparency, discount mechanisms, and overall value for money experience."
+        ),
+        Runner.run(
+            gift_agent,
+            "Explore MercadoLivre's gift-buying experience including gift categories, services, delivery options, and overall gifting ecosystem."
+        )
     )
+    print(f"Tech Enthusiast Feedback: {tech_result.final_output}")
+    print(f"Budget Shopper Feedback: {budget_result.final_output}")
     print(f"Gift Buyer Feedback: {gift_result.final_output}")
     
     # Phase 4: Synthesis and Analysis
@@ -87,27 +85,32 @@ async def run_mercadolivre_exploration():
         "budget_shopper": budget_result.final_output,
         "gift_buyer": gift_result.final_output
     }
-    
-    synthesis_result = await Runner.run(
-        ml_comm_agent,
-        f"Synthesize this multi-agent feedback into actionable insights: {json.dumps(all_feedback, indent=2)}"
+    feedback_json = json.dumps(all_feedback, indent=2)
+    
+    # Synthesis, company analysis and oversight each read only the combined feedback,
+    # so phases 4-6 run concurrently and report in order
+    synthesis_result, company_analysis_result, oversight_result = await asyncio.gather(
+        Runner.run(
+            ml_comm_agent,
+            f"Synthesize this multi-agent feedback into actionable insights: {feedback_json}"
+        ),
+        Runner.run(
+            company_analysis_agent,
+            f"Curate, clean, and analyze this MercadoLivre feedback data, then provide specific departmental recommendations: {feedback_json}"
+        ),
+        Runner.run(
+            oversight_agent,
+            f"Validate the quality and completeness of this MercadoLivre exploration data: {feedback_json}. Provide a final assessment."
+        )
     )
     print(f"Synthesis Results: {synthesis_result.final_output}")
     
     # Phase 5: Company Analysis & Departmental Recommendations
     print("\n🏢 Phase 5: Company Analysis & Departmental Recommendations...")
-    company_analysis_result = await Runner.run(
-        company_analysis_agent,
-        f"Curate, clean, and analyze this MercadoLivre feedback data, then provide specific departmental recommendations: {json.dumps(all_feedback, indent=2)}"
-    )
     print(f"Company Analysis: {company_analysis_result.final_output}")
     
     # Phase 6: Oversight and Quality Validation
     print("\n✅ Phase 6: Quality Validation and Final Report...")
-    oversight_result = await Runner.run(
-        oversight_agent,
-        f"Validate the quality and completeness of this MercadoLivre exploration data: {json.dumps(all_feedback, indent=2)}. Provide a final assessment."
-    )
     print(f"Quality Assessment: {oversight_result.final_output}")
     
     # Final Summary
@@ -176,4 +179,4 @@ async def main():
     return exploration_results
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_async(main())
\ No newline at end of file
@@ -1,12 +1,12 @@
 import asyncio
 import json
-from agents import Agent, Runner, function_tool
+from agents import Agent, Runner, function_tool, print_result
 from typing import Dict, List, Any
 import os
 
 # Load OpenAI API key from environment variable
-from dotenv import load_dotenv
-load_dotenv()
+from _env import ensure_env
+ensure_env()
 
 @function_tool
 def validate_data_completeness(data_type: str) -> Dict[str, Any]:
@@ -47,7 +47,7 @@ agent = Agent(
 
 async def main():
     result = await Runner.run(agent, "Process and validate incoming feedback data")
-    print("Processing Result:", result.final_output)
+    print_result("Processing Result:", result)
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
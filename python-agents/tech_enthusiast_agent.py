@@ -1,10 +1,10 @@
 import asyncio
 import json
-from agents import Agent, Runner, function_tool
+from agents import Agent, Runner, function_tool, print_result
 from typing import Dict, List, Any
 import os
-from dotenv import load_dotenv
-load_dotenv()
+from _env import ensure_env
+ensure_env()
 
 @function_tool
 def explore_electronics_section() -> Dict[str, Any]:
@@ -100,7 +100,7 @@ agent = Agent(
 
 async def main():
     result = await Runner.run(agent, "Explore MercadoLivre's electronics section and provide tech enthusiast feedback")
-    print("Tech Enthusiast Feedback:", result.final_output)
+    print_result("Tech Enthusiast Feedback:", result)
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
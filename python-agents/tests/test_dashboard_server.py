@@ -0,0 +1,42 @@
+import unittest
+import sys
+import os
+
+# Add the repository root to path to import the dashboard server
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from dashboard_server import app
+
+
+class TestAiAnalysis(unittest.TestCase):
+    """Tests for the /ai-analysis endpoint"""
+
+    PERSONA_TYPES = {
+        "tech_enthusiast", "budget_shopper", "gift_buyer", "family_shopper",
+        "business_buyer", "senior_shopper", "luxury_shopper"
+    }
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = app.test_client()
+
+    def test_ai_analysis_succeeds(self):
+        """Test that /ai-analysis returns a JSON analysis instead of an error"""
+        response = self.client.get('/ai-analysis')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('sentiment_analysis', response.get_json())
+
+    def test_sentiment_covers_every_persona(self):
+        """Test that every sentiment category has an entry for all 7 persona types"""
+        sentiment_analysis = self.client.get('/ai-analysis').get_json()['sentiment_analysis']
+
+        self.assertTrue(sentiment_analysis)
+        for category, by_persona in sentiment_analysis.items():
+            self.assertEqual(set(by_persona), self.PERSONA_TYPES, category)
+            for scores in by_persona.values():
+                self.assertIn('sentiment_score', scores)
+
+
+if __name__ == '__main__':
+    unittest.main()
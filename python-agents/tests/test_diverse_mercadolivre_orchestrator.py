@@ -11,7 +11,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from diverse_mercadolivre_orchestrator import (
     MercadoLivreExplorationOrchestrator, 
-    DatabaseService
+    DatabaseService,
+    AsyncMemo
 )
 
 class TestDatabaseService(unittest.IsolatedAsyncioTestCase):
@@ -71,6 +72,39 @@ class TestDatabaseService(unittest.IsolatedAsyncioTestCase):
             self.assertIn('time_spent_minutes', persona['customization']['custom_attributes'])
 
 
+class TestAsyncMemo(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AsyncMemo class"""
+    
+    @patch('diverse_mercadolivre_orchestrator.Runner.run')
+    async def test_concurrent_duplicates_run_once(self, mock_run):
+        """Test that identical concurrent calls share a single Runner.run"""
+        async def slow_run(agent, prompt):
+            await asyncio.sleep(0.01)
+            return MagicMock(final_output=prompt)
+        mock_run.side_effect = slow_run
+        agent = MagicMock()
+        memo = AsyncMemo()
+        
+        results = await asyncio.gather(*(memo.run(agent, "same prompt") for _ in range(3)))
+        again = await memo.run(agent, "same prompt")
+        
+        self.assertEqual(mock_run.call_count, 1)
+        self.assertTrue(all(result is again for result in results))
+    
+    @patch('diverse_mercadolivre_orchestrator.Runner.run')
+    async def test_distinct_prompts_not_shared(self, mock_run):
+        """Test that different prompts each get their own run"""
+        mock_run.side_effect = lambda agent, prompt: MagicMock(final_output=prompt)
+        agent = MagicMock()
+        memo = AsyncMemo()
+        
+        first = await memo.run(agent, "prompt one")
+        second = await memo.run(agent, "prompt two")
+        
+        self.assertEqual(mock_run.call_count, 2)
+        self.assertEqual(first.final_output, "prompt one")
+        self.assertEqual(second.final_output, "prompt two")
+
 class TestMercadoLivreExplorationOrchestrator(unittest.IsolatedAsyncioTestCase):
     """Tests for the MercadoLivreExplorationOrchestrator class"""
     
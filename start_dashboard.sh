@@ -20,7 +20,7 @@ fi
 
 # Check dependencies
 echo "📦 Checking dependencies..."
-pip install flask flask-cors > /dev/null 2>&1
+pip install flask flask-cors orjson flask-compress > /dev/null 2>&1
 
 # Make the dashboard server executable
 chmod +x dashboard_server.py
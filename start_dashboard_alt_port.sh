@@ -26,7 +26,7 @@ source .venv/bin/activate
 
 # Install Flask if not already installed
 echo "📦 Checking dependencies..."
-pip install flask flask-cors > /dev/null 2>&1
+pip install flask flask-cors orjson flask-compress > /dev/null 2>&1
 
 # Make the dashboard server executable
 chmod +x dashboard_server.py
@@ -0,0 +1,7 @@
+"""
+WSGI entry point for the MercadoLivre AI Agent Dashboard
+
+    gunicorn -c gunicorn_conf.py wsgi:app
+"""
+
+from dashboard_server import app